@@ -17,6 +17,13 @@ from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 
+# Faster JSON parsing (optional)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -220,7 +227,7 @@ class AILanguageService:
                 if content.startswith("json"):
                     content = content[4:]
 
-            result = json.loads(content)
+            result = _json_loads(content)
 
             # Ensure required fields
             return {
@@ -0,0 +1,83 @@
+"""
+Shared helpers for the multilingual test scripts.
+
+Holds the language tables, the responses.py label loader and the output
+helpers used by test_multilingual.py, test_multilingual_simple.py and
+test_integration_multilingual.py.
+"""
+
+import ast
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+from functools import wraps
+from typing import Dict, List, Optional
+
+RESPONSES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "common", "i18n", "responses.py")
+
+# All 11 supported languages
+LANGUAGES = ["en", "hi", "bn", "ta", "te", "kn", "ml", "gu", "mr", "pa", "or"]
+
+LANGUAGE_NAMES = {
+    "en": "English",
+    "hi": "Hindi",
+    "bn": "Bengali",
+    "ta": "Tamil",
+    "te": "Telugu",
+    "kn": "Kannada",
+    "ml": "Malayalam",
+    "gu": "Gujarati",
+    "mr": "Marathi",
+    "pa": "Punjabi",
+    "or": "Odia",
+}
+
+
+def load_labels(names) -> Dict[str, dict]:
+    """Load only the named label dictionaries from responses.py.
+
+    Only the matching top-level assignments are compiled and executed, so
+    the rest of the module and its imports are never run.
+    """
+    names = set(names)
+    with open(RESPONSES_PATH, "r") as f:
+        tree = ast.parse(f.read(), RESPONSES_PATH)
+    wanted = [
+        node for node in tree.body
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) in names
+    ]
+    namespace = {}
+    exec(compile(ast.Module(body=wanted, type_ignores=[]), RESPONSES_PATH, "exec"), namespace)
+    return {name: namespace.get(name, {}) for name in names}
+
+
+def completeness_report(labels_dict, required_keys) -> Dict[str, Optional[List[str]]]:
+    """Return the missing keys for each language.
+
+    A language absent from the dict maps to None.
+    """
+    return {
+        lang: None if lang not in labels_dict else [
+            key for key in required_keys if not labels_dict[lang].get(key)
+        ]
+        for lang in LANGUAGES
+    }
+
+
+def truncate(text: str, width: int) -> str:
+    """Cut text to width characters, without copying when it already fits."""
+    return text if len(text) <= width else text[:width]
+
+
+def buffered_output(test_fn):
+    """Collect a test function's prints and write them to stdout in one call."""
+    @wraps(test_fn)
+    def wrapper(*args, **kwargs):
+        buf = io.StringIO()
+        try:
+            with redirect_stdout(buf):
+                return test_fn(*args, **kwargs)
+        finally:
+            sys.stdout.write(buf.getvalue())
+    return wrapper
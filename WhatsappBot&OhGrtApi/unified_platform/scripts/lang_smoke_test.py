@@ -1,4 +1,5 @@
 import asyncio
+import sys
 
 from common.config.settings import settings
 from common.services.ai_language_service import ai_understand_message, ai_translate_response
@@ -18,7 +19,7 @@ SAMPLES = {
 
 
 async def main() -> None:
-    print("OPENAI_API_KEY set:", bool(settings.OPENAI_API_KEY))
+    print("OPENAI_API_KEY set:", bool(settings.OPENAI_API_KEY), flush=True)
 
     for lang, text in SAMPLES.items():
         result = await ai_understand_message(text, openai_api_key=settings.OPENAI_API_KEY)
@@ -28,9 +29,12 @@ async def main() -> None:
             lang,
             openai_api_key=settings.OPENAI_API_KEY,
         )
-        print(f"\nInput[{lang}]: {text}")
-        print("Detected:", detected)
-        print("Translated:", translated)
+        # One write per sample, shown as soon as its API calls finish
+        sys.stdout.write(
+            "\nInput[%s]: %s\nDetected: %s\nTranslated: %s\n"
+            % (lang, text, detected, translated)
+        )
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -3,28 +3,56 @@ Advanced Test Cases for Multilingual WhatsApp Bot
 Tests edge cases, error handling, additional features, and boundary conditions.
 """
 
+import ast
+import os
+import re
 import sys
-sys.path.insert(0, "/Users/rishi/Desktop/WorkSpace/AIBot/WhatsappBot&OhGrtApi/unified_platform")
+from statistics import fmean
+from types import MappingProxyType
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
 
 # Read responses.py directly
-responses_path = "/Users/rishi/Desktop/WorkSpace/AIBot/WhatsappBot&OhGrtApi/unified_platform/common/i18n/responses.py"
+responses_path = os.path.join(BASE_DIR, "common", "i18n", "responses.py")
 with open(responses_path, 'r') as f:
     content = f.read()
 
-exec_globals = {}
-exec(content, exec_globals)
-
-# Get all label dictionaries
-WORD_GAME_LABELS = exec_globals.get('WORD_GAME_LABELS', {})
-EVENT_LABELS = exec_globals.get('EVENT_LABELS', {})
-LOCAL_SEARCH_LABELS = exec_globals.get('LOCAL_SEARCH_LABELS', {})
-FOOD_LABELS = exec_globals.get('FOOD_LABELS', {})
-SUBSCRIPTION_LABELS = exec_globals.get('SUBSCRIPTION_LABELS', {})
-COMMON_PHRASES = exec_globals.get('COMMON_PHRASES', {})
-ASTRO_LABELS = exec_globals.get('ASTRO_LABELS', {})
-LIFE_PREDICTION_LABELS = exec_globals.get('LIFE_PREDICTION_LABELS', {})
-HELP_LABELS = exec_globals.get('HELP_LABELS', {})
-TRAIN_LABELS = exec_globals.get('TRAIN_LABELS', {})
+# Get all label dictionaries (evaluated as literals; nothing else in responses.py runs)
+LABEL_NAMES = {
+    "WORD_GAME_LABELS", "EVENT_LABELS", "LOCAL_SEARCH_LABELS", "FOOD_LABELS",
+    "SUBSCRIPTION_LABELS", "COMMON_PHRASES", "ASTRO_LABELS",
+    "LIFE_PREDICTION_LABELS", "HELP_LABELS", "TRAIN_LABELS",
+}
+
+
+def freeze_labels(value):
+    """Recursively wrap dicts as read-only mappings with interned string keys."""
+    if isinstance(value, dict):
+        return MappingProxyType({
+            sys.intern(k) if isinstance(k, str) else k: freeze_labels(v)
+            for k, v in value.items()
+        })
+    return value
+
+
+label_dicts = {}
+for node in ast.parse(content, responses_path).body:
+    if isinstance(node, ast.Assign) and len(node.targets) == 1:
+        name = getattr(node.targets[0], "id", None)
+        if name in LABEL_NAMES:
+            label_dicts[name] = freeze_labels(ast.literal_eval(node.value))
+
+WORD_GAME_LABELS = label_dicts.get('WORD_GAME_LABELS', {})
+EVENT_LABELS = label_dicts.get('EVENT_LABELS', {})
+LOCAL_SEARCH_LABELS = label_dicts.get('LOCAL_SEARCH_LABELS', {})
+FOOD_LABELS = label_dicts.get('FOOD_LABELS', {})
+SUBSCRIPTION_LABELS = label_dicts.get('SUBSCRIPTION_LABELS', {})
+COMMON_PHRASES = label_dicts.get('COMMON_PHRASES', {})
+ASTRO_LABELS = label_dicts.get('ASTRO_LABELS', {})
+LIFE_PREDICTION_LABELS = label_dicts.get('LIFE_PREDICTION_LABELS', {})
+HELP_LABELS = label_dicts.get('HELP_LABELS', {})
+TRAIN_LABELS = label_dicts.get('TRAIN_LABELS', {})
 
 LANGUAGES = ["en", "hi", "bn", "ta", "te", "kn", "ml", "gu", "mr", "pa", "or"]
 LANGUAGE_NAMES = {
@@ -33,19 +61,86 @@ LANGUAGE_NAMES = {
     "mr": "Marathi", "pa": "Punjabi", "or": "Odia",
 }
 
+# Native script per language, as Unicode block ranges
+SCRIPT_PATTERNS = {
+    "hi": re.compile(r"[\u0900-\u097F]"),  # Devanagari
+    "bn": re.compile(r"[\u0980-\u09FF]"),  # Bengali
+    "ta": re.compile(r"[\u0B80-\u0BFF]"),  # Tamil
+    "te": re.compile(r"[\u0C00-\u0C7F]"),  # Telugu
+    "kn": re.compile(r"[\u0C80-\u0CFF]"),  # Kannada
+    "ml": re.compile(r"[\u0D00-\u0D7F]"),  # Malayalam
+    "gu": re.compile(r"[\u0A80-\u0AFF]"),  # Gujarati
+    "mr": re.compile(r"[\u0900-\u097F]"),  # Marathi (Devanagari)
+    "pa": re.compile(r"[\u0A00-\u0A7F]"),  # Gurmukhi
+    "or": re.compile(r"[\u0B00-\u0B7F]"),  # Odia
+}
+
+# Keys that must be translated in every language (also used by test_labels_param.py)
+IPL_KEYS = ("ipl_title", "no_ipl", "ticket_details")
+ENTERTAINMENT_KEYS = ("concerts_title", "comedy_title", "no_concerts", "no_comedy")
+SUBSCRIPTION_FLOW_KEYS = ("title", "daily_horoscope", "transit_alerts", "subscribed", "unsubscribed", "no_subscriptions", "error")
+WORD_GAME_FLOW_KEYS = ("start", "correct", "wrong", "play_again", "error")
+COMMON_ERROR_KEYS = ("error_occurred",)
+
 
 def get_label(labels_dict: dict, key: str, lang: str, **kwargs) -> str:
     """Get a label with fallback to English."""
     lang_labels = labels_dict.get(lang, labels_dict.get("en", {}))
     template = lang_labels.get(key, key)
-    if kwargs:
+    # Templates without braces need no formatting at all
+    if kwargs and ("{" in template or "}" in template):
         try:
-            return template.format(**kwargs)
+            return template.format_map(kwargs)
         except (KeyError, ValueError):
             return template
     return template
 
 
+# Truncate long labels only for interactive terminals; redirected logs keep full text
+_TRUNCATE = sys.stdout.isatty()
+
+
+def clip(text: str, width: int) -> str:
+    """Shorten text for display on a terminal."""
+    return text[:width] if _TRUNCATE else text
+
+
+_MATRIX_CACHE = {}
+
+
+def label_matrix(labels_dict: dict, keys: tuple) -> dict:
+    """Pivot labels to {key: (label for each of LANGUAGES)}, cached per dict."""
+    cache_key = (id(labels_dict), keys)
+    matrix = _MATRIX_CACHE.get(cache_key)
+    if matrix is None:
+        rows = [labels_dict.get(lang, labels_dict.get("en", {})) for lang in LANGUAGES]
+        matrix = {key: tuple(row.get(key, key) for row in rows) for key in keys}
+        _MATRIX_CACHE[cache_key] = matrix
+    return matrix
+
+
+def is_translated(label: str, key: str) -> bool:
+    """A label is translated when it is not just the key fallback."""
+    return label != key and len(label) > 3
+
+
+def check_label_matrix(labels_dict: dict, keys: tuple, width: int = 50) -> bool:
+    """Print every (key, language) label and return True if all have content."""
+    matrix = label_matrix(labels_dict, keys)
+    passed = {
+        key: [is_translated(label, key) for label in row]
+        for key, row in matrix.items()
+    }
+
+    for key in keys:
+        print(f"\n--- {key} ---")
+        for lang, label, has_content in zip(LANGUAGES, matrix[key], passed[key]):
+            status = "✅" if has_content else "❌"
+            print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {clip(label, width)}")
+
+    return all(all(row) for row in passed.values())
+
+
 # ============================================================
 # TEST 1: EDGE CASES - Fallback to English
 # ============================================================
@@ -64,9 +159,9 @@ def test_fallback_to_english():
         english_result = get_label(EVENT_LABELS, "found", "en", count=5)
 
         if result == english_result:
-            print(f"  ✅ '{unknown_lang}' -> Falls back to English: {result[:40]}")
+            print(f"  ✅ '{unknown_lang}' -> Falls back to English: {clip(result, 40)}")
         else:
-            print(f"  ❌ '{unknown_lang}' -> Unexpected result: {result[:40]}")
+            print(f"  ❌ '{unknown_lang}' -> Unexpected result: {clip(result, 40)}")
             all_passed = False
 
     return all_passed
@@ -108,31 +203,17 @@ def test_unicode_handling():
 
     all_passed = True
 
-    # Test each language's script
-    expected_scripts = {
-        "hi": "देवनागरी",  # Devanagari
-        "bn": "বাংলা",     # Bengali
-        "ta": "தமிழ்",     # Tamil
-        "te": "తెలుగు",    # Telugu
-        "kn": "ಕನ್ನಡ",     # Kannada
-        "ml": "മലയാളം",   # Malayalam
-        "gu": "ગુજરાતી",   # Gujarati
-        "mr": "मराठी",     # Marathi (Devanagari)
-        "pa": "ਪੰਜਾਬੀ",    # Gurmukhi
-        "or": "ଓଡ଼ିଆ",     # Odia
-    }
-
-    for lang, script_sample in expected_scripts.items():
+    for lang, script_re in SCRIPT_PATTERNS.items():
         labels = EVENT_LABELS.get(lang, {})
         found_text = labels.get("found", "")
 
-        # Check if text contains non-ASCII (native script)
-        has_native = any(ord(c) > 127 for c in found_text)
+        # Check that text is written in the language's own script
+        has_native = script_re.search(found_text) is not None
 
         if has_native:
-            print(f"  ✅ {LANGUAGE_NAMES[lang]:12} ({lang}): Contains native script - {found_text[:30]}")
+            print(f"  ✅ {LANGUAGE_NAMES[lang]:12} ({lang}): Contains native script - {clip(found_text, 30)}")
         else:
-            print(f"  ❌ {LANGUAGE_NAMES[lang]:12} ({lang}): No native script found - {found_text[:30]}")
+            print(f"  ❌ {LANGUAGE_NAMES[lang]:12} ({lang}): No native script found - {clip(found_text, 30)}")
             all_passed = False
 
     return all_passed
@@ -165,7 +246,7 @@ def test_astro_labels():
             print(f"  ❌ {LANGUAGE_NAMES[lang]} ({lang}): Missing keys: {missing}")
             all_passed = False
         else:
-            sample = ASTRO_LABELS[lang].get("title", "")[:40]
+            sample = clip(ASTRO_LABELS[lang].get("title", ""), 40)
             print(f"  ✅ {LANGUAGE_NAMES[lang]} ({lang}): {sample}")
 
     return all_passed
@@ -197,7 +278,7 @@ def test_life_prediction_labels():
         if missing:
             print(f"  ⚠️  {LANGUAGE_NAMES[lang]} ({lang}): Missing optional keys: {missing}")
         else:
-            sample = LIFE_PREDICTION_LABELS[lang].get("title", "")[:40]
+            sample = clip(LIFE_PREDICTION_LABELS[lang].get("title", ""), 40)
             print(f"  ✅ {LANGUAGE_NAMES[lang]} ({lang}): {sample}")
 
     return True  # Optional labels
@@ -223,7 +304,6 @@ def test_help_labels():
             print(f"  ⚠️  {LANGUAGE_NAMES[lang]} ({lang}): Missing (will use English)")
             continue
 
-        sample = str(HELP_LABELS[lang])[:60] if HELP_LABELS[lang] else "empty"
         print(f"  ✅ {LANGUAGE_NAMES[lang]} ({lang}): Present")
 
     return all_passed
@@ -242,31 +322,31 @@ def test_error_messages():
 
     # Test word game error
     print("\n--- Word Game Error ---")
-    for lang in LANGUAGES:
-        error_msg = get_label(WORD_GAME_LABELS, "error", lang)
-        has_content = len(error_msg) > 5 and error_msg != "error"
+    error_msgs = label_matrix(WORD_GAME_LABELS, ("error",))["error"]
+    for lang, error_msg in zip(LANGUAGES, error_msgs):
+        has_content = error_msg != "error" and len(error_msg) > 5
         status = "✅" if has_content else "❌"
-        print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {error_msg[:50]}")
+        print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {clip(error_msg, 50)}")
         if not has_content:
             all_passed = False
 
     # Test subscription error
     print("\n--- Subscription Error ---")
-    for lang in LANGUAGES:
-        error_msg = get_label(SUBSCRIPTION_LABELS, "error", lang)
-        has_content = len(error_msg) > 5 and error_msg != "error"
+    error_msgs = label_matrix(SUBSCRIPTION_LABELS, ("error",))["error"]
+    for lang, error_msg in zip(LANGUAGES, error_msgs):
+        has_content = error_msg != "error" and len(error_msg) > 5
         status = "✅" if has_content else "❌"
-        print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {error_msg[:50]}")
+        print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {clip(error_msg, 50)}")
         if not has_content:
             all_passed = False
 
     # Test common error phrase
     print("\n--- Common Error Phrase ---")
-    for lang in LANGUAGES:
-        error_msg = get_label(COMMON_PHRASES, "error_occurred", lang)
-        has_content = len(error_msg) > 5 and error_msg != "error_occurred"
+    error_msgs = label_matrix(COMMON_PHRASES, COMMON_ERROR_KEYS)["error_occurred"]
+    for lang, error_msg in zip(LANGUAGES, error_msgs):
+        has_content = error_msg != "error_occurred" and len(error_msg) > 5
         status = "✅" if has_content else "❌"
-        print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {error_msg[:50]}")
+        print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {clip(error_msg, 50)}")
         if not has_content:
             all_passed = False
 
@@ -282,20 +362,7 @@ def test_ipl_labels():
     print("TEST 8: IPL-SPECIFIC LABELS")
     print("=" * 70)
 
-    ipl_keys = ["ipl_title", "no_ipl", "ticket_details"]
-    all_passed = True
-
-    for key in ipl_keys:
-        print(f"\n--- {key} ---")
-        for lang in LANGUAGES:
-            label = get_label(EVENT_LABELS, key, lang)
-            has_content = len(label) > 3 and label != key
-            status = "✅" if has_content else "❌"
-            print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {label[:50]}")
-            if not has_content:
-                all_passed = False
-
-    return all_passed
+    return check_label_matrix(EVENT_LABELS, IPL_KEYS)
 
 
 # ============================================================
@@ -307,20 +374,7 @@ def test_entertainment_labels():
     print("TEST 9: ENTERTAINMENT LABELS (Concerts & Comedy)")
     print("=" * 70)
 
-    entertainment_keys = ["concerts_title", "comedy_title", "no_concerts", "no_comedy"]
-    all_passed = True
-
-    for key in entertainment_keys:
-        print(f"\n--- {key} ---")
-        for lang in LANGUAGES:
-            label = get_label(EVENT_LABELS, key, lang)
-            has_content = len(label) > 3 and label != key
-            status = "✅" if has_content else "❌"
-            print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {label[:50]}")
-            if not has_content:
-                all_passed = False
-
-    return all_passed
+    return check_label_matrix(EVENT_LABELS, ENTERTAINMENT_KEYS)
 
 
 # ============================================================
@@ -353,15 +407,15 @@ def test_placeholder_edge_cases():
         result = get_label(LOCAL_SEARCH_LABELS, "searching", "en", query=query)
         safe = "&" not in result or "café" in result  # Basic check
         status = "✅" if safe else "⚠️"
-        print(f"  {status} Query '{query}': {result[:50]}")
+        print(f"  {status} Query '{query}': {clip(result, 50)}")
 
     # Test with empty string
     print("\n--- Empty string values ---")
     result = get_label(LOCAL_SEARCH_LABELS, "searching", "en", query="")
-    print(f"  Empty query: {result[:50]}")
+    print(f"  Empty query: {clip(result, 50)}")
 
     result = get_label(EVENT_LABELS, "events_near", "en", city="")
-    print(f"  Empty city: {result[:50]}")
+    print(f"  Empty city: {clip(result, 50)}")
 
     return all_passed
 
@@ -379,7 +433,7 @@ def test_train_labels():
         print("  ⚠️  TRAIN_LABELS not found - checking for Hindi/English specific labels")
         # Try to read train_status.py for HINDI_LABELS/ENGLISH_LABELS
         try:
-            train_path = "/Users/rishi/Desktop/WorkSpace/AIBot/WhatsappBot&OhGrtApi/unified_platform/whatsapp_bot/graph/nodes/train_status.py"
+            train_path = os.path.join(BASE_DIR, "whatsapp_bot", "graph", "nodes", "train_status.py")
             with open(train_path, 'r') as f:
                 train_content = f.read()
 
@@ -422,12 +476,10 @@ def test_response_length_consistency():
 
     for labels_dict, key in test_labels:
         print(f"\n--- {key} ---")
-        lengths = {}
-        for lang in LANGUAGES:
-            text = get_label(labels_dict, key, lang)
-            lengths[lang] = len(text)
+        texts = {lang: get_label(labels_dict, key, lang) for lang in LANGUAGES}
+        lengths = {lang: len(text) for lang, text in texts.items()}
 
-        avg_len = sum(lengths.values()) / len(lengths)
+        avg_len = fmean(lengths.values())
 
         for lang, length in lengths.items():
             # Flag if length is <30% or >300% of average
@@ -441,8 +493,7 @@ def test_response_length_consistency():
             else:
                 status = "✅"
 
-            text = get_label(labels_dict, key, lang)[:30]
-            print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {length:3} chars - {text}...")
+            print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {length:3} chars - {clip(texts[lang], 30)}...")
 
     return all_passed
 
@@ -456,20 +507,7 @@ def test_subscription_flow():
     print("TEST 13: SUBSCRIPTION FLOW LABELS")
     print("=" * 70)
 
-    flow_keys = ["title", "daily_horoscope", "transit_alerts", "subscribed", "unsubscribed", "no_subscriptions", "error"]
-    all_passed = True
-
-    for key in flow_keys:
-        print(f"\n--- {key} ---")
-        for lang in LANGUAGES:
-            label = get_label(SUBSCRIPTION_LABELS, key, lang)
-            has_content = len(label) > 3 and label != key
-            status = "✅" if has_content else "❌"
-            print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {label[:45]}")
-            if not has_content:
-                all_passed = False
-
-    return all_passed
+    return check_label_matrix(SUBSCRIPTION_LABELS, SUBSCRIPTION_FLOW_KEYS, width=45)
 
 
 # ============================================================
@@ -481,21 +519,19 @@ def test_word_game_complete_flow():
     print("TEST 14: WORD GAME COMPLETE FLOW")
     print("=" * 70)
 
-    flow_keys = ["start", "correct", "wrong", "play_again", "error"]
     all_passed = True
 
-    for key in flow_keys:
+    matrix = label_matrix(WORD_GAME_LABELS, WORD_GAME_FLOW_KEYS)
+    for key in WORD_GAME_FLOW_KEYS:
         print(f"\n--- {key} ---")
-        for lang in LANGUAGES:
+        for lang, label in zip(LANGUAGES, matrix[key]):
             if key == "correct":
                 label = get_label(WORD_GAME_LABELS, key, lang, word="APPLE")
-            else:
-                label = get_label(WORD_GAME_LABELS, key, lang)
 
-            has_content = len(label) > 3 and label != key
-            status = "✅" if has_content else "❌"
-            print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {label[:45]}")
-            if not has_content:
+            translated = is_translated(label, key)
+            status = "✅" if translated else "❌"
+            print(f"  {status} {LANGUAGE_NAMES[lang]:12}: {clip(label, 45)}")
+            if not translated:
                 all_passed = False
 
     return all_passed
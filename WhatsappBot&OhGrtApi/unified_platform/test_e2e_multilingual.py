@@ -3,9 +3,14 @@ End-to-End Multilingual Test Suite
 Tests complete user journey simulations, stress tests, and edge cases.
 """
 
+import io
+import re
 import sys
-import random
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from string import Formatter
+from time import perf_counter_ns
 sys.path.insert(0, "/Users/rishi/Desktop/WorkSpace/AIBot/WhatsappBot&OhGrtApi/unified_platform")
 
 # Read responses.py directly
@@ -34,18 +39,149 @@ LANGUAGE_NAMES = {
 }
 
 
+# Status icon indexed by a pass/fail bool: STATUS[False] / STATUS[True]
+STATUS = ("❌", "✅")
+
+# Leading/trailing whitespace or a double space anywhere
+WHITESPACE_ISSUE_RE = re.compile(r"\A\s|\s\Z|  ")
+
+# Flattened (dict id, lang, key) -> label table so a hit is a single dict probe.
+# Codes and keys are interned so they compare by identity with the literals callers pass.
+FLAT_LABELS = {
+    (id(labels_dict), sys.intern(lang), sys.intern(key)): value
+    for labels_dict in (
+        WORD_GAME_LABELS, EVENT_LABELS, LOCAL_SEARCH_LABELS, FOOD_LABELS,
+        SUBSCRIPTION_LABELS, COMMON_PHRASES, LIFE_PREDICTION_LABELS, TRAIN_LABELS,
+    )
+    for lang, lang_labels in labels_dict.items()
+    for key, value in lang_labels.items()
+}
+
+# Bound format_map of every templated label, so calls skip the **kwargs rebuild
+FLAT_FORMATTERS = {
+    flat_key: value.format_map
+    for flat_key, value in FLAT_LABELS.items()
+    if isinstance(value, str) and "{" in value
+}
+
+
+def to_percent_template(template: str):
+    """Rewrite a template with one plain "{name}" field as ("...%s...", name), else None."""
+    if "{{" in template or "}}" in template:
+        return None
+    try:
+        fields = [
+            (name, spec, conversion)
+            for _, name, spec, conversion in Formatter().parse(template)
+            if name is not None
+        ]
+    except ValueError:
+        return None
+    if len(fields) != 1:
+        return None
+    name, spec, conversion = fields[0]
+    if spec or conversion or not name.isidentifier():
+        return None
+    return template.replace("%", "%%").replace("{" + name + "}", "%s"), name
+
+
+# Single-placeholder labels ({count}, {query}, {word}, ...) rendered with % instead of format
+FLAT_PERCENT_TEMPLATES = {
+    flat_key: percent_template
+    for flat_key, percent_template in (
+        (flat_key, to_percent_template(FLAT_LABELS[flat_key])) for flat_key in FLAT_FORMATTERS
+    )
+    if percent_template is not None
+}
+
+
 def get_label(labels_dict: dict, key: str, lang: str, **kwargs) -> str:
     """Get a label with fallback to English."""
-    lang_labels = labels_dict.get(lang, labels_dict.get("en", {}))
-    template = lang_labels.get(key, key)
+    flat_key = (id(labels_dict), lang, key)
+    template = FLAT_LABELS.get(flat_key)
+    if template is None:
+        lang_labels = labels_dict.get(lang, labels_dict.get("en", {}))
+        template = lang_labels.get(key, key)
     if kwargs:
+        percent_template = FLAT_PERCENT_TEMPLATES.get(flat_key)
+        if percent_template is not None:
+            text, name = percent_template
+            return text % (kwargs[name],) if name in kwargs else template
+        render = FLAT_FORMATTERS.get(flat_key)
+        if render is None:
+            render = template.format_map
         try:
-            return template.format(**kwargs)
+            return render(kwargs)
         except (KeyError, ValueError):
             return template
     return template
 
 
+# Journey steps only depend on the language, so each is built once per language
+@lru_cache(maxsize=None)
+def event_journey(lang: str) -> tuple:
+    """Bot messages for the event discovery journey."""
+    # Step 1: User asks for events
+    looking = get_label(EVENT_LABELS, "looking_for_events", lang)
+
+    # Step 2: Events found
+    found = get_label(EVENT_LABELS, "found", lang, count=5)
+    at_label = get_label(EVENT_LABELS, "at", lang)
+
+    # Step 3: More details
+    more_details = get_label(EVENT_LABELS, "more_details", lang)
+
+    return (
+        f"Bot: {looking[:40]}...",
+        f"Bot: {found} ... {at_label} 7:00 PM",
+        f"Bot: {more_details[:40]}...",
+    )
+
+
+@lru_cache(maxsize=None)
+def local_search_journey(lang: str) -> tuple:
+    """Bot messages for the local 'near me' search journey."""
+    # Step 1: Ask for location
+    ask_loc = get_label(LOCAL_SEARCH_LABELS, "ask_location", lang)
+
+    # Step 2: Searching
+    searching = get_label(LOCAL_SEARCH_LABELS, "searching", lang, query="restaurant")
+
+    # Step 3: Results found
+    found_places = get_label(LOCAL_SEARCH_LABELS, "found_places", lang)
+    away = get_label(LOCAL_SEARCH_LABELS, "away", lang)
+    reviews = get_label(LOCAL_SEARCH_LABELS, "reviews", lang)
+
+    return (
+        f"Bot: {ask_loc[:50]}...",
+        f"Bot: {searching[:50]}...",
+        f"Bot: {found_places} - 0.5 km {away} (150 {reviews})",
+    )
+
+
+@lru_cache(maxsize=None)
+def word_game_journey(lang: str) -> tuple:
+    """Bot messages for the word game journey."""
+    # Step 1: Start game
+    start = get_label(WORD_GAME_LABELS, "start", lang)
+
+    # Step 2: Wrong answer
+    wrong = get_label(WORD_GAME_LABELS, "wrong", lang)
+
+    # Step 3: Correct answer
+    correct = get_label(WORD_GAME_LABELS, "correct", lang, word="MANGO")
+
+    # Step 4: Play again prompt
+    play_again = get_label(WORD_GAME_LABELS, "play_again", lang)
+
+    return (
+        f"Bot: {start[:40]}...",
+        f"Bot: {wrong}",
+        f"Bot: {correct[:40]}...",
+        f"Bot: {play_again[:40]}...",
+    )
+
+
 # ============================================================
 # TEST 1: COMPLETE USER JOURNEY SIMULATION
 # ============================================================
@@ -60,20 +196,7 @@ def test_user_journey_simulation():
     # Journey 1: Event Discovery Flow
     print("\n--- Journey: Event Discovery ---")
     for lang in ["en", "hi", "ta", "bn", "kn"]:
-        journey_steps = []
-
-        # Step 1: User asks for events
-        looking = get_label(EVENT_LABELS, "looking_for_events", lang)
-        journey_steps.append(f"Bot: {looking[:40]}...")
-
-        # Step 2: Events found
-        found = get_label(EVENT_LABELS, "found", lang, count=5)
-        at_label = get_label(EVENT_LABELS, "at", lang)
-        journey_steps.append(f"Bot: {found} ... {at_label} 7:00 PM")
-
-        # Step 3: More details
-        more_details = get_label(EVENT_LABELS, "more_details", lang)
-        journey_steps.append(f"Bot: {more_details[:40]}...")
+        journey_steps = event_journey(lang)
 
         print(f"\n  {LANGUAGE_NAMES[lang]} ({lang}):")
         for step in journey_steps:
@@ -89,21 +212,7 @@ def test_user_journey_simulation():
     # Journey 2: Local Search Flow
     print("\n--- Journey: Local Search 'Near Me' ---")
     for lang in ["en", "hi", "ta", "te", "ml"]:
-        journey_steps = []
-
-        # Step 1: Ask for location
-        ask_loc = get_label(LOCAL_SEARCH_LABELS, "ask_location", lang)
-        journey_steps.append(f"Bot: {ask_loc[:50]}...")
-
-        # Step 2: Searching
-        searching = get_label(LOCAL_SEARCH_LABELS, "searching", lang, query="restaurant")
-        journey_steps.append(f"Bot: {searching[:50]}...")
-
-        # Step 3: Results found
-        found_places = get_label(LOCAL_SEARCH_LABELS, "found_places", lang)
-        away = get_label(LOCAL_SEARCH_LABELS, "away", lang)
-        reviews = get_label(LOCAL_SEARCH_LABELS, "reviews", lang)
-        journey_steps.append(f"Bot: {found_places} - 0.5 km {away} (150 {reviews})")
+        journey_steps = local_search_journey(lang)
 
         print(f"\n  {LANGUAGE_NAMES[lang]} ({lang}):")
         for step in journey_steps:
@@ -118,23 +227,7 @@ def test_user_journey_simulation():
     # Journey 3: Word Game Flow
     print("\n--- Journey: Word Game ---")
     for lang in ["en", "hi", "gu", "mr", "pa"]:
-        journey_steps = []
-
-        # Step 1: Start game
-        start = get_label(WORD_GAME_LABELS, "start", lang)
-        journey_steps.append(f"Bot: {start[:40]}...")
-
-        # Step 2: Wrong answer
-        wrong = get_label(WORD_GAME_LABELS, "wrong", lang)
-        journey_steps.append(f"Bot: {wrong}")
-
-        # Step 3: Correct answer
-        correct = get_label(WORD_GAME_LABELS, "correct", lang, word="MANGO")
-        journey_steps.append(f"Bot: {correct[:40]}...")
-
-        # Step 4: Play again prompt
-        play_again = get_label(WORD_GAME_LABELS, "play_again", lang)
-        journey_steps.append(f"Bot: {play_again[:40]}...")
+        journey_steps = word_game_journey(lang)
 
         print(f"\n  {LANGUAGE_NAMES[lang]} ({lang}):")
         for step in journey_steps:
@@ -164,26 +257,28 @@ def test_rapid_language_switching():
 
     print(f"\n  Running {iterations} rapid language switches...")
 
-    start_time = time.time()
+    # Lookup to run for each label type
+    lookups = {
+        "event": lambda lang, count: get_label(EVENT_LABELS, "found", lang, count=count),
+        "local": lambda lang, count: get_label(LOCAL_SEARCH_LABELS, "searching", lang, query="test"),
+        "word": lambda lang, count: get_label(WORD_GAME_LABELS, "correct", lang, word="TEST"),
+        "food": lambda lang, count: get_label(FOOD_LABELS, "title", lang),
+        "sub": lambda lang, count: get_label(SUBSCRIPTION_LABELS, "subscribed", lang),
+    }
 
-    for i in range(iterations):
-        # Random language
-        lang = random.choice(LANGUAGES)
+    # Draw all random inputs up front so the timed loop only does lookups.
+    # random is only needed here, so it is imported lazily.
+    import random
+    randint = random.randint
+    langs = random.choices(LANGUAGES, k=iterations)
+    label_types = random.choices(list(lookups), k=iterations)
+    counts = [randint(1, 100) for _ in range(iterations)]
 
-        # Random label type
-        label_type = random.choice(["event", "local", "word", "food", "sub"])
+    start_ns = perf_counter_ns()
 
+    for lang, label_type, count in zip(langs, label_types, counts):
         try:
-            if label_type == "event":
-                result = get_label(EVENT_LABELS, "found", lang, count=random.randint(1, 100))
-            elif label_type == "local":
-                result = get_label(LOCAL_SEARCH_LABELS, "searching", lang, query="test")
-            elif label_type == "word":
-                result = get_label(WORD_GAME_LABELS, "correct", lang, word="TEST")
-            elif label_type == "food":
-                result = get_label(FOOD_LABELS, "title", lang)
-            else:
-                result = get_label(SUBSCRIPTION_LABELS, "subscribed", lang)
+            result = lookups[label_type](lang, count)
 
             if not result or len(result) < 3:
                 errors.append(f"Empty result for {label_type} in {lang}")
@@ -192,10 +287,10 @@ def test_rapid_language_switching():
             errors.append(f"Error in {label_type}/{lang}: {str(e)}")
             all_passed = False
 
-    elapsed = time.time() - start_time
+    elapsed_ns = perf_counter_ns() - start_ns
 
-    print(f"  Completed {iterations} iterations in {elapsed:.3f}s")
-    print(f"  Average: {(elapsed/iterations)*1000:.2f}ms per lookup")
+    print(f"  Completed {iterations} iterations in {elapsed_ns / 1e9:.3f}s")
+    print(f"  Average: {elapsed_ns / iterations / 1e6:.2f}ms per lookup")
 
     if errors:
         print(f"  ❌ {len(errors)} errors found:")
@@ -238,7 +333,7 @@ def test_all_labels_exhaustive():
             continue
 
         # Get all keys from English as reference
-        en_keys = set(labels_dict.get("en", {}).keys())
+        en_keys = labels_dict.get("en", {}).keys()
         print(f"\n  --- {dict_name} ({len(en_keys)} keys) ---")
 
         dict_issues = []
@@ -250,17 +345,13 @@ def test_all_labels_exhaustive():
                 continue
 
             lang_labels = labels_dict[lang]
-            lang_missing = []
-            lang_empty = []
-
-            for key in en_keys:
-                total_labels += 1
-                if key not in lang_labels:
-                    lang_missing.append(key)
-                    missing_labels += 1
-                elif not lang_labels[key]:
-                    lang_empty.append(key)
-                    empty_labels += 1
+            lang_keys = lang_labels.keys()
+            lang_missing = list(en_keys - lang_keys)
+            lang_empty = [key for key in en_keys & lang_keys if not lang_labels[key]]
+
+            total_labels += len(en_keys)
+            missing_labels += len(lang_missing)
+            empty_labels += len(lang_empty)
 
             if lang_missing or lang_empty:
                 issues = []
@@ -300,6 +391,8 @@ def test_emoji_preservation():
     print("TEST 4: EMOJI AND SPECIAL CHARACTER PRESERVATION")
     print("=" * 70)
 
+    lines = []
+
     all_passed = True
 
     # Test emojis with different scripts
@@ -315,25 +408,31 @@ def test_emoji_preservation():
         ("❌", "Cross"),
     ]
 
-    print("\n  Testing emoji + native script combinations:")
+    lines.append("\n  Testing emoji + native script combinations:")
+
+    # The label and display name don't depend on the emoji; look them up once
+    languages = [
+        (LANGUAGE_NAMES[lang], get_label(EVENT_LABELS, "found", lang, count=5))
+        for lang in ["en", "hi", "ta", "bn", "ml"]
+    ]
 
     for emoji, desc in test_cases:
-        print(f"\n  --- {emoji} {desc} ---")
-        for lang in ["en", "hi", "ta", "bn", "ml"]:
+        lines.append(f"\n  --- {emoji} {desc} ---")
+        for lang_name, found in languages:
             # Combine emoji with native text
-            found = get_label(EVENT_LABELS, "found", lang, count=5)
             combined = f"{emoji} {found}"
 
-            # Check emoji is preserved
-            has_emoji = emoji in combined
-            has_text = len(found) > 5
+            # Check emoji is preserved at the front and the text is present
+            valid = combined.startswith(emoji) and len(found) > 5
 
-            status = "✅" if (has_emoji and has_text) else "❌"
-            print(f"    {status} {LANGUAGE_NAMES[lang]:12}: {combined[:50]}")
+            status = STATUS[valid]
+            lines.append(f"    {status} {lang_name:12}: {combined[:50]}")
 
-            if not (has_emoji and has_text):
+            if not valid:
                 all_passed = False
 
+    sys.stdout.write("\n".join(lines) + "\n")
+
     return all_passed
 
 
@@ -346,25 +445,32 @@ def test_number_formatting():
     print("TEST 5: NUMBER FORMATTING")
     print("=" * 70)
 
+    lines = []
+
     all_passed = True
 
     test_numbers = [0, 1, 10, 100, 1000, 99999]
 
-    print("\n  Testing number placeholders:")
+    lines.append("\n  Testing number placeholders:")
+
+    languages = [(lang, LANGUAGE_NAMES[lang]) for lang in LANGUAGES]
 
     for num in test_numbers:
-        print(f"\n  --- Count: {num} ---")
-        for lang in LANGUAGES:
+        lines.append(f"\n  --- Count: {num} ---")
+        num_text = str(num)
+        for lang, lang_name in languages:
             result = get_label(EVENT_LABELS, "found", lang, count=num)
 
             # Check number appears in result
-            has_number = str(num) in result
-            status = "✅" if has_number else "❌"
-            print(f"    {status} {LANGUAGE_NAMES[lang]:12}: {result[:45]}")
+            has_number = num_text in result
+            status = STATUS[has_number]
+            lines.append(f"    {status} {lang_name:12}: {result[:45]}")
 
             if not has_number:
                 all_passed = False
 
+    sys.stdout.write("\n".join(lines) + "\n")
+
     return all_passed
 
 
@@ -399,6 +505,10 @@ def test_whitespace_formatting():
                 if not isinstance(value, str):
                     continue
 
+                # One regex scan rules out the common clean case
+                if not WHITESPACE_ISSUE_RE.search(value):
+                    continue
+
                 # Check for issues
                 if value.startswith(" ") or value.endswith(" "):
                     issues.append(f"{dict_name}/{lang}/{key}: Leading/trailing space")
@@ -499,13 +609,14 @@ def test_cross_language_consistency():
 
     for labels_dict, key, must_contain, desc in consistency_checks:
         print(f"\n  --- {key}: Must contain '{must_contain}' ({desc}) ---")
+        needle = must_contain.lower()
 
         for lang in LANGUAGES:
             if lang not in labels_dict:
                 continue
 
             value = labels_dict[lang].get(key, "")
-            contains = must_contain.lower() in value.lower()
+            contains = needle in value.lower()
 
             status = "✅" if contains else "⚠️"
             print(f"    {status} {LANGUAGE_NAMES[lang]:12}: {value[:45]}...")
@@ -530,29 +641,25 @@ def test_multi_user_simulation():
 
     # Simulate 11 users, each with a different language
     users = [
-        {"id": f"user_{i}", "lang": lang, "phone": f"91987654321{i}"}
+        {"id": f"user_{i}", "lang": lang, "name": LANGUAGE_NAMES[lang], "phone": f"91987654321{i}"}
         for i, lang in enumerate(LANGUAGES)
     ]
 
     print(f"\n  Simulating {len(users)} concurrent users:")
 
     # Each user performs a sequence of actions
-    actions = ["search_event", "play_word_game", "search_local", "subscribe"]
+    actions = {
+        "search_event": lambda lang: get_label(EVENT_LABELS, "found", lang, count=3),
+        "play_word_game": lambda lang: get_label(WORD_GAME_LABELS, "start", lang),
+        "search_local": lambda lang: get_label(LOCAL_SEARCH_LABELS, "found_places", lang),
+        "subscribe": lambda lang: get_label(SUBSCRIPTION_LABELS, "subscribed", lang),
+    }
 
     results = {user["id"]: [] for user in users}
 
-    for action in actions:
+    for action, respond in actions.items():
         for user in users:
-            lang = user["lang"]
-
-            if action == "search_event":
-                response = get_label(EVENT_LABELS, "found", lang, count=3)
-            elif action == "play_word_game":
-                response = get_label(WORD_GAME_LABELS, "start", lang)
-            elif action == "search_local":
-                response = get_label(LOCAL_SEARCH_LABELS, "found_places", lang)
-            elif action == "subscribe":
-                response = get_label(SUBSCRIPTION_LABELS, "subscribed", lang)
+            response = respond(user["lang"])
 
             results[user["id"]].append({
                 "action": action,
@@ -564,9 +671,9 @@ def test_multi_user_simulation():
     for user in users:
         user_results = results[user["id"]]
         all_valid = all(r["valid"] for r in user_results)
-        status = "✅" if all_valid else "❌"
+        status = STATUS[all_valid]
 
-        print(f"\n  {status} {user['id']} ({LANGUAGE_NAMES[user['lang']]}):")
+        print(f"\n  {status} {user['id']} ({user['name']}):")
         for r in user_results:
             print(f"      {r['action']}: {r['response']}...")
 
@@ -585,50 +692,54 @@ def test_error_recovery():
     print("TEST 10: ERROR RECOVERY SCENARIOS")
     print("=" * 70)
 
+    lines = []
+
     all_passed = True
 
-    print("\n  Testing error recovery in all languages:")
+    lines.append("\n  Testing error recovery in all languages:")
 
     # Scenario 1: Event search fails
-    print("\n  --- Scenario: Event search returns no results ---")
+    lines.append("\n  --- Scenario: Event search returns no results ---")
     for lang in LANGUAGES:
         not_found = get_label(EVENT_LABELS, "not_found", lang)
         has_content = len(not_found) > 5
-        status = "✅" if has_content else "❌"
-        print(f"    {status} {LANGUAGE_NAMES[lang]:12}: {not_found[:40]}")
+        status = STATUS[has_content]
+        lines.append(f"    {status} {LANGUAGE_NAMES[lang]:12}: {not_found[:40]}")
         if not has_content:
             all_passed = False
 
     # Scenario 2: Local search fails
-    print("\n  --- Scenario: Local search no results ---")
+    lines.append("\n  --- Scenario: Local search no results ---")
     for lang in LANGUAGES:
         no_places = get_label(LOCAL_SEARCH_LABELS, "no_places_for", lang, query="xyz")
         has_content = len(no_places) > 5
-        status = "✅" if has_content else "❌"
-        print(f"    {status} {LANGUAGE_NAMES[lang]:12}: {no_places[:40]}")
+        status = STATUS[has_content]
+        lines.append(f"    {status} {LANGUAGE_NAMES[lang]:12}: {no_places[:40]}")
         if not has_content:
             all_passed = False
 
     # Scenario 3: Subscription error
-    print("\n  --- Scenario: Subscription process fails ---")
+    lines.append("\n  --- Scenario: Subscription process fails ---")
     for lang in LANGUAGES:
         error = get_label(SUBSCRIPTION_LABELS, "error", lang)
         has_content = len(error) > 5
-        status = "✅" if has_content else "❌"
-        print(f"    {status} {LANGUAGE_NAMES[lang]:12}: {error[:40]}")
+        status = STATUS[has_content]
+        lines.append(f"    {status} {LANGUAGE_NAMES[lang]:12}: {error[:40]}")
         if not has_content:
             all_passed = False
 
     # Scenario 4: Word game error
-    print("\n  --- Scenario: Word game crashes ---")
+    lines.append("\n  --- Scenario: Word game crashes ---")
     for lang in LANGUAGES:
         error = get_label(WORD_GAME_LABELS, "error", lang)
         has_content = len(error) > 5
-        status = "✅" if has_content else "❌"
-        print(f"    {status} {LANGUAGE_NAMES[lang]:12}: {error[:40]}")
+        status = STATUS[has_content]
+        lines.append(f"    {status} {LANGUAGE_NAMES[lang]:12}: {error[:40]}")
         if not has_content:
             all_passed = False
 
+    sys.stdout.write("\n".join(lines) + "\n")
+
     return all_passed
 
 
@@ -652,30 +763,32 @@ def test_full_message_builder():
         and_more = get_label(EVENT_LABELS, "and_more", lang, count=5)
         more_details = get_label(EVENT_LABELS, "more_details", lang)
 
-        message = f"""🎫 *{found}:*
-
-*1. Coldplay Concert*
-📍 Mumbai Stadium
-📅 Jan 25, 2025 {at_label} 7:00 PM
-💰 ₹2,500 - ₹15,000
-
-*2. Arijit Singh Live*
-📍 Bengaluru Arena
-📅 Feb 10, 2025 {at_label} 8:00 PM
-💰 ₹1,500 - ₹8,000
-
-_{and_more}_
-
-📱 {more_details}"""
+        message = "\n".join([
+            "🎫 *" + found + ":*",
+            "",
+            "*1. Coldplay Concert*",
+            "📍 Mumbai Stadium",
+            "📅 Jan 25, 2025 " + at_label + " 7:00 PM",
+            "💰 ₹2,500 - ₹15,000",
+            "",
+            "*2. Arijit Singh Live*",
+            "📍 Bengaluru Arena",
+            "📅 Feb 10, 2025 " + at_label + " 8:00 PM",
+            "💰 ₹1,500 - ₹8,000",
+            "",
+            "_" + and_more + "_",
+            "",
+            "📱 " + more_details,
+        ])
 
         # Validate message
         has_emoji = "🎫" in message and "📍" in message
-        has_native_text = any(ord(c) > 127 for c in message) if lang != "en" else True
+        has_native_text = lang == "en" or not message.isascii()
         has_structure = "*1." in message and "*2." in message
 
         valid = has_emoji and has_native_text and has_structure
 
-        status = "✅" if valid else "❌"
+        status = STATUS[valid]
         print(f"\n  {status} {LANGUAGE_NAMES[lang]} ({lang}):")
         print("    " + message.replace("\n", "\n    ")[:300] + "...")
 
@@ -703,26 +816,28 @@ def test_performance_benchmark():
         get_label(EVENT_LABELS, "found", "hi", count=5)
 
     # Benchmark
-    start = time.time()
+    nlang = len(LANGUAGES)
+    start_ns = perf_counter_ns()
     for i in range(iterations):
-        lang = LANGUAGES[i % len(LANGUAGES)]
+        lang = LANGUAGES[i % nlang]
         get_label(EVENT_LABELS, "found", lang, count=i)
         get_label(LOCAL_SEARCH_LABELS, "searching", lang, query="test")
         get_label(WORD_GAME_LABELS, "start", lang)
-    elapsed = time.time() - start
+    elapsed_ns = perf_counter_ns() - start_ns
 
-    ops_per_sec = (iterations * 3) / elapsed
-    avg_ms = (elapsed / (iterations * 3)) * 1000
+    operations = iterations * 3
+    ops_per_sec = operations * 1_000_000_000 // elapsed_ns
+    avg_ns = elapsed_ns // operations
 
     print(f"\n  Results:")
-    print(f"    Total operations: {iterations * 3}")
-    print(f"    Total time: {elapsed:.3f}s")
-    print(f"    Operations/sec: {ops_per_sec:,.0f}")
-    print(f"    Average per lookup: {avg_ms:.4f}ms")
+    print(f"    Total operations: {operations}")
+    print(f"    Total time: {elapsed_ns / 1e9:.3f}s")
+    print(f"    Operations/sec: {ops_per_sec:,}")
+    print(f"    Average per lookup: {avg_ns / 1e6:.4f}ms ({avg_ns:,}ns)")
 
     # Pass if performance is reasonable (< 1ms per lookup)
-    passed = avg_ms < 1.0
-    status = "✅" if passed else "❌"
+    passed = avg_ns < 1_000_000
+    status = STATUS[passed]
     print(f"\n  {status} Performance {'acceptable' if passed else 'needs improvement'}")
 
     return passed
@@ -731,7 +846,49 @@ def test_performance_benchmark():
 # ============================================================
 # MAIN
 # ============================================================
+E2E_TESTS = {
+    "User Journey Simulation": test_user_journey_simulation,
+    "Rapid Language Switching": test_rapid_language_switching,
+    "Exhaustive Label Check": test_all_labels_exhaustive,
+    "Emoji Preservation": test_emoji_preservation,
+    "Number Formatting": test_number_formatting,
+    "Whitespace Formatting": test_whitespace_formatting,
+    "Placeholder Consistency": test_placeholder_consistency,
+    "Cross-Language Consistency": test_cross_language_consistency,
+    "Multi-User Simulation": test_multi_user_simulation,
+    "Error Recovery": test_error_recovery,
+    "Full Message Builder": test_full_message_builder,
+    "Performance Benchmark": test_performance_benchmark,
+}
+
+# Timed tests run alone so concurrent work doesn't skew their measurements
+TIMED_TESTS = ("Rapid Language Switching", "Performance Benchmark")
+
+
+class ThreadOutputRouter(io.TextIOBase):
+    """Stand-in for sys.stdout that sends each worker thread's writes to its own buffer."""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        return getattr(self._local, "buffer", self.fallback).write(text)
+
+    def run(self, test_fn):
+        """Run a test with this thread's output captured; return (result, output)."""
+        self._local.buffer = io.StringIO()
+        try:
+            return test_fn(), self._local.buffer.getvalue()
+        finally:
+            del self._local.buffer
+
+
 def main():
+    # Redirected runs (CI logs, files) don't need per-line flushing; the buffer flushes on exit
+    if not sys.stdout.isatty() and hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     print("=" * 70)
     print("END-TO-END MULTILINGUAL TEST SUITE")
     print("Comprehensive testing of WhatsApp bot multilingual system")
@@ -739,19 +896,32 @@ def main():
 
     results = {}
 
-    # Run all tests
-    results["User Journey Simulation"] = test_user_journey_simulation()
-    results["Rapid Language Switching"] = test_rapid_language_switching()
-    results["Exhaustive Label Check"] = test_all_labels_exhaustive()
-    results["Emoji Preservation"] = test_emoji_preservation()
-    results["Number Formatting"] = test_number_formatting()
-    results["Whitespace Formatting"] = test_whitespace_formatting()
-    results["Placeholder Consistency"] = test_placeholder_consistency()
-    results["Cross-Language Consistency"] = test_cross_language_consistency()
-    results["Multi-User Simulation"] = test_multi_user_simulation()
-    results["Error Recovery"] = test_error_recovery()
-    results["Full Message Builder"] = test_full_message_builder()
-    results["Performance Benchmark"] = test_performance_benchmark()
+    # Run the independent tests on a thread pool, each into its own output
+    # buffer, and replay the buffers in order so the report stays readable
+    router = ThreadOutputRouter(sys.stdout)
+    sys.stdout = router
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                name: pool.submit(router.run, test_fn)
+                for name, test_fn in E2E_TESTS.items()
+                if name not in TIMED_TESTS
+            }
+            for name, future in futures.items():
+                results[name], output = future.result()
+                router.fallback.write(output)
+    finally:
+        sys.stdout = router.fallback
+
+    # The timed tests keep their numbers but run last, alone, so the
+    # thread pool does not skew their timings
+    print("\n" + "=" * 70)
+    print("TIMED TESTS (run after the others, one at a time)")
+    print("=" * 70)
+    for name in TIMED_TESTS:
+        results[name] = E2E_TESTS[name]()
+
+    results = {name: results[name] for name in E2E_TESTS}
 
     # Summary
     print("\n" + "=" * 70)
@@ -7,35 +7,45 @@ import sys
 sys.path.insert(0, "/Users/rishi/Desktop/WorkSpace/AIBot/WhatsappBot&OhGrtApi/unified_platform")
 
 import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from string import Formatter
+from types import MappingProxyType
 from typing import Dict, Any
 
-# Read responses.py directly to avoid import chain issues
-responses_path = "/Users/rishi/Desktop/WorkSpace/AIBot/WhatsappBot&OhGrtApi/unified_platform/common/i18n/responses.py"
-with open(responses_path, 'r') as f:
-    content = f.read()
-
-exec_globals = {}
-exec(content, exec_globals)
-
-# Get all label dictionaries
-WORD_GAME_LABELS = exec_globals.get('WORD_GAME_LABELS', {})
-EVENT_LABELS = exec_globals.get('EVENT_LABELS', {})
-LOCAL_SEARCH_LABELS = exec_globals.get('LOCAL_SEARCH_LABELS', {})
-FOOD_LABELS = exec_globals.get('FOOD_LABELS', {})
-SUBSCRIPTION_LABELS = exec_globals.get('SUBSCRIPTION_LABELS', {})
-COMMON_PHRASES = exec_globals.get('COMMON_PHRASES', {})
-ASTRO_LABELS = exec_globals.get('ASTRO_LABELS', {})
-LIFE_PREDICTION_LABELS = exec_globals.get('LIFE_PREDICTION_LABELS', {})
-HELP_LABELS = exec_globals.get('HELP_LABELS', {})
-
-# All 11 supported languages
-LANGUAGES = ["en", "hi", "bn", "ta", "te", "kn", "ml", "gu", "mr", "pa", "or"]
-
-LANGUAGE_NAMES = {
-    "en": "English", "hi": "Hindi", "bn": "Bengali", "ta": "Tamil",
-    "te": "Telugu", "kn": "Kannada", "ml": "Malayalam", "gu": "Gujarati",
-    "mr": "Marathi", "pa": "Punjabi", "or": "Odia",
-}
+from multilingual_test_helpers import (
+    LANGUAGE_NAMES,
+    LANGUAGES,
+    buffered_output,
+    completeness_report,
+    load_labels,
+    truncate,
+)
+
+LABELS = load_labels((
+    "WORD_GAME_LABELS",
+    "EVENT_LABELS",
+    "LOCAL_SEARCH_LABELS",
+    "FOOD_LABELS",
+    "SUBSCRIPTION_LABELS",
+    "COMMON_PHRASES",
+    "ASTRO_LABELS",
+    "LIFE_PREDICTION_LABELS",
+    "HELP_LABELS",
+))
+
+# Get all label dictionaries (read-only for the whole run)
+WORD_GAME_LABELS = MappingProxyType(LABELS.get('WORD_GAME_LABELS', {}))
+EVENT_LABELS = MappingProxyType(LABELS.get('EVENT_LABELS', {}))
+LOCAL_SEARCH_LABELS = MappingProxyType(LABELS.get('LOCAL_SEARCH_LABELS', {}))
+FOOD_LABELS = MappingProxyType(LABELS.get('FOOD_LABELS', {}))
+SUBSCRIPTION_LABELS = MappingProxyType(LABELS.get('SUBSCRIPTION_LABELS', {}))
+COMMON_PHRASES = MappingProxyType(LABELS.get('COMMON_PHRASES', {}))
+ASTRO_LABELS = MappingProxyType(LABELS.get('ASTRO_LABELS', {}))
+LIFE_PREDICTION_LABELS = MappingProxyType(LABELS.get('LIFE_PREDICTION_LABELS', {}))
+HELP_LABELS = MappingProxyType(LABELS.get('HELP_LABELS', {}))
+
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
 
 # Sample user messages in different languages (simulating what users might type)
 SAMPLE_USER_MESSAGES = {
@@ -87,16 +97,73 @@ SAMPLE_USER_MESSAGES = {
 }
 
 
+# Label dictionaries by id, for the flat and pre-parsed template tables
+_DICTS = {id(d): d for d in (
+    WORD_GAME_LABELS, EVENT_LABELS, LOCAL_SEARCH_LABELS, FOOD_LABELS,
+    SUBSCRIPTION_LABELS, COMMON_PHRASES, ASTRO_LABELS,
+    LIFE_PREDICTION_LABELS, HELP_LABELS,
+)}
+
+# Flat (dict id, lang, key) -> template view of every label; a language a
+# dict does not cover resolves to its English labels, as in the nested lookup
+_FLAT = {
+    (labels_id, lang, key): template
+    for labels_id, labels_dict in _DICTS.items()
+    for lang in LANGUAGES
+    for key, template in labels_dict.get(lang, labels_dict.get("en", {})).items()
+}
+
+
+def compile_template(template: str):
+    """Split a format string into (literal, field name) pairs.
+
+    Returns None for templates that need the full str.format machinery
+    (format specs, conversions, positional or attribute fields, bad braces).
+    """
+    parts = []
+    try:
+        for literal, field, spec, conversion in Formatter().parse(template):
+            if field is not None and (spec or conversion or not field.isidentifier()):
+                return None
+            parts.append((literal, field))
+    except ValueError:
+        return None
+    return tuple(parts)
+
+
+# Parsed templates for every label, keyed by (dict id, lang, key)
+_COMPILED = {
+    (labels_id, lang, key): compile_template(template)
+    for labels_id, labels_dict in _DICTS.items()
+    for lang, lang_labels in labels_dict.items()
+    if isinstance(lang_labels, dict)
+    for key, template in lang_labels.items()
+    if isinstance(template, str)
+}
+
+
 def get_label(labels_dict: dict, key: str, lang: str, **kwargs) -> str:
     """Get a label with fallback to English."""
-    lang_labels = labels_dict.get(lang, labels_dict.get("en", {}))
-    template = lang_labels.get(key, key)
-    if kwargs:
-        try:
-            return template.format(**kwargs)
-        except (KeyError, ValueError):
+    if not kwargs:
+        template = _FLAT.get((id(labels_dict), lang, key))
+        if template is not None:
             return template
-    return template
+
+    resolved_lang = lang if lang in labels_dict else "en"
+    template = labels_dict.get(resolved_lang, {}).get(key, key)
+    if not kwargs:
+        return template
+
+    parts = _COMPILED.get((id(labels_dict), resolved_lang, key))
+    try:
+        if parts is None:
+            return template.format(**kwargs)
+        return "".join([
+            literal if field is None else literal + str(kwargs[field])
+            for literal, field in parts
+        ])
+    except (KeyError, ValueError):
+        return template
 
 
 class MockBotState:
@@ -127,10 +194,11 @@ def simulate_event_response(lang: str, events_count: int = 3) -> str:
     at_label = get_label(EVENT_LABELS, "at", lang)
     more_details = get_label(EVENT_LABELS, "more_details", lang)
 
-    response = f"🎫 *{found}:*\n\n"
-    response += f"*1. Sample Event*\n📍 Venue, City\n📅 Jan 20, 2025 {at_label} 7:00 PM\n💰 ₹500 - ₹2000\n\n"
-    response += f"📱 {more_details}"
-    return response
+    return (
+        f"🎫 *{found}:*\n\n"
+        f"*1. Sample Event*\n📍 Venue, City\n📅 Jan 20, 2025 {at_label} 7:00 PM\n💰 ₹500 - ₹2000\n\n"
+        f"📱 {more_details}"
+    )
 
 
 def simulate_local_search_response(lang: str, places_count: int = 3) -> str:
@@ -142,9 +210,10 @@ def simulate_local_search_response(lang: str, places_count: int = 3) -> str:
     away = get_label(LOCAL_SEARCH_LABELS, "away", lang)
     reviews = get_label(LOCAL_SEARCH_LABELS, "reviews", lang)
 
-    response = f"*Restaurant near your location*\n\n*{found_places}:*\n\n"
-    response += f"1. *Sample Place*\n   📏 0.5 km {away}\n   📍 Address\n   ⭐⭐⭐⭐ 4.2 (150 {reviews})\n"
-    return response
+    return (
+        f"*Restaurant near your location*\n\n*{found_places}:*\n\n"
+        f"1. *Sample Place*\n   📏 0.5 km {away}\n   📍 Address\n   ⭐⭐⭐⭐ 4.2 (150 {reviews})\n"
+    )
 
 
 def simulate_word_game_response(lang: str, is_correct: bool = False) -> str:
@@ -184,16 +253,14 @@ def test_response_simulation(feature: str, simulate_fn, lang: str, **kwargs) ->
         # Check response is not empty and not just the key
         has_content = len(response) > 10
         # Check it contains some non-ASCII chars for non-English (indicates translation)
-        if lang != "en":
-            has_native_text = any(ord(c) > 127 for c in response)
-        else:
-            has_native_text = True
+        has_native_text = lang == "en" or _NON_ASCII_RE.search(response) is not None
 
-        return (has_content and has_native_text, response[:100])
+        return (has_content and has_native_text, truncate(response, 100))
     except Exception as e:
-        return (False, f"ERROR: {str(e)[:50]}")
+        return (False, f"ERROR: {truncate(str(e), 50)}")
 
 
+@buffered_output
 def run_broad_tests():
     """Run broad integration tests across all features and languages."""
     print("=" * 70)
@@ -215,18 +282,31 @@ def run_broad_tests():
         ("Subscription - Menu", simulate_subscription_response, {}),
     ]
 
+    # Every (feature, language) simulation is independent, so run the sweep
+    # on a pool and print the collected results in order afterwards
+    tasks = [
+        (feature_name, simulate_fn, lang, kwargs)
+        for feature_name, simulate_fn, kwargs in features
+        for lang in LANGUAGES
+    ]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        outcomes = iter(pool.map(
+            lambda task: test_response_simulation(task[0], task[1], task[2], **task[3]),
+            tasks,
+        ))
+
     for feature_name, simulate_fn, kwargs in features:
         print(f"\n{'=' * 60}")
         print(f"TESTING: {feature_name}")
         print("=" * 60)
 
-        feature_results = []
+        feature_results = {}
         for lang in LANGUAGES:
-            passed, sample = test_response_simulation(feature_name, simulate_fn, lang, **kwargs)
-            feature_results.append((lang, passed))
+            passed, sample = next(outcomes)
+            feature_results[lang] = passed
 
             status = "✅" if passed else "❌"
-            print(f"{status} {LANGUAGE_NAMES[lang]:12} ({lang}): {sample[:60]}...")
+            print(f"{status} {LANGUAGE_NAMES[lang]:12} ({lang}): {truncate(sample, 60)}...")
 
         results[feature_name] = feature_results
 
@@ -235,28 +315,31 @@ def run_broad_tests():
     print("SUMMARY BY FEATURE")
     print("=" * 70)
 
-    all_passed = True
-    for feature_name, feature_results in results.items():
-        passed_count = sum(1 for _, p in feature_results if p)
-        total = len(feature_results)
-        status = "✅" if passed_count == total else "❌"
-        print(f"{status} {feature_name}: {passed_count}/{total} languages")
-        if passed_count != total:
-            all_passed = False
+    feature_rows = [
+        (feature_name, sum(feature_results.values()), len(feature_results))
+        for feature_name, feature_results in results.items()
+    ]
+    all_passed = all(passed == total for _, passed, total in feature_rows)
+    print("\n".join(
+        f"{'✅' if passed == total else '❌'} {feature_name}: {passed}/{total} languages"
+        for feature_name, passed, total in feature_rows
+    ))
 
     # Summary by Language
     print("\n" + "=" * 70)
     print("SUMMARY BY LANGUAGE")
     print("=" * 70)
 
-    for lang in LANGUAGES:
-        lang_passed = sum(
-            1 for feature_results in results.values()
-            for l, p in feature_results if l == lang and p
-        )
-        lang_total = len(results)
-        status = "✅" if lang_passed == lang_total else "❌"
-        print(f"{status} {LANGUAGE_NAMES[lang]:12} ({lang}): {lang_passed}/{lang_total} features")
+    lang_total = len(results)
+    lang_rows = [
+        (lang, sum(feature_results[lang] for feature_results in results.values()))
+        for lang in LANGUAGES
+    ]
+    print("\n".join(
+        f"{'✅' if passed == lang_total else '❌'} {LANGUAGE_NAMES[lang]:12} ({lang}): "
+        f"{passed}/{lang_total} features"
+        for lang, passed in lang_rows
+    ))
 
     print("\n" + "=" * 70)
     if all_passed:
@@ -268,6 +351,7 @@ def run_broad_tests():
     return all_passed
 
 
+@buffered_output
 def test_label_completeness():
     """Test that all label dictionaries have all required keys for all languages."""
     print("\n" + "=" * 70)
@@ -288,17 +372,15 @@ def test_label_completeness():
     for label_name, (labels_dict, required_keys) in label_sets.items():
         print(f"\n--- {label_name} ---")
 
+        report = completeness_report(labels_dict, required_keys)
+
         for lang in LANGUAGES:
-            if lang not in labels_dict:
+            missing = report[lang]
+            if missing is None:
                 print(f"  ❌ {LANGUAGE_NAMES[lang]} ({lang}): MISSING LANGUAGE")
                 all_complete = False
                 continue
 
-            missing = []
-            for key in required_keys:
-                if key not in labels_dict[lang] or not labels_dict[lang][key]:
-                    missing.append(key)
-
             if missing:
                 print(f"  ❌ {LANGUAGE_NAMES[lang]} ({lang}): Missing {missing}")
                 all_complete = False
@@ -308,6 +390,7 @@ def test_label_completeness():
     return all_complete
 
 
+@buffered_output
 def test_format_string_placeholders():
     """Test that format strings work correctly with placeholders."""
     print("\n" + "=" * 70)
@@ -325,29 +408,33 @@ def test_format_string_placeholders():
     ]
 
     all_passed = True
+    names = LANGUAGE_NAMES
 
     for labels_dict, key, kwargs, placeholder_name in test_cases:
         print(f"\n--- Testing '{key}' with {{{placeholder_name}}} ---")
 
-        for lang in LANGUAGES:
+        # Resolve each language's dict once per test case
+        en_fallback = labels_dict.get("en", {})
+        lang_dicts = [(lang, labels_dict.get(lang, en_fallback)) for lang in LANGUAGES]
+        placeholder = f"{{{placeholder_name}}}"
+        value = str(kwargs[placeholder_name])
+
+        for lang, lang_labels in lang_dicts:
             try:
-                lang_labels = labels_dict.get(lang, labels_dict.get("en", {}))
                 template = lang_labels.get(key, "")
                 result = template.format(**kwargs)
 
                 # Check placeholder was replaced
-                placeholder = f"{{{placeholder_name}}}"
                 if placeholder in result:
-                    print(f"  ❌ {LANGUAGE_NAMES[lang]} ({lang}): Placeholder not replaced")
+                    print(f"  ❌ {names[lang]} ({lang}): Placeholder not replaced")
                     all_passed = False
                 else:
-                    value = kwargs[placeholder_name]
-                    if str(value) in result:
-                        print(f"  ✅ {LANGUAGE_NAMES[lang]} ({lang}): {result[:50]}")
+                    if value in result:
+                        print(f"  ✅ {names[lang]} ({lang}): {truncate(result, 50)}")
                     else:
-                        print(f"  ⚠️  {LANGUAGE_NAMES[lang]} ({lang}): Value not in result - {result[:50]}")
+                        print(f"  ⚠️  {names[lang]} ({lang}): Value not in result - {truncate(result, 50)}")
             except Exception as e:
-                print(f"  ❌ {LANGUAGE_NAMES[lang]} ({lang}): ERROR - {str(e)[:30]}")
+                print(f"  ❌ {names[lang]} ({lang}): ERROR - {truncate(str(e), 30)}")
                 all_passed = False
 
     return all_passed
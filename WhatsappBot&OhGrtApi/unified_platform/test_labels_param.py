@@ -0,0 +1,49 @@
+"""
+Parametrized Label Tests for Multilingual WhatsApp Bot
+
+Pytest version of the (labels dict, key, language) content checks in
+test_advanced_multilingual.py. The label tables, key lists and get_label
+come from that script, so the two stay in step. Every cell is its own test
+case, so one missing translation does not hide the rest, and the suite can
+be spread across workers with pytest-xdist:
+
+    pytest -n auto test_labels_param.py
+"""
+
+import pytest
+
+from test_advanced_multilingual import (
+    COMMON_ERROR_KEYS,
+    COMMON_PHRASES,
+    ENTERTAINMENT_KEYS,
+    EVENT_LABELS,
+    IPL_KEYS,
+    LANGUAGES,
+    SUBSCRIPTION_FLOW_KEYS,
+    SUBSCRIPTION_LABELS,
+    WORD_GAME_FLOW_KEYS,
+    WORD_GAME_LABELS,
+    get_label,
+    is_translated,
+)
+
+# (name, labels dict, keys that must be translated in every language)
+LABEL_SETS = [
+    ("WORD_GAME_LABELS", WORD_GAME_LABELS, WORD_GAME_FLOW_KEYS),
+    ("EVENT_LABELS", EVENT_LABELS, IPL_KEYS + ENTERTAINMENT_KEYS),
+    ("SUBSCRIPTION_LABELS", SUBSCRIPTION_LABELS, SUBSCRIPTION_FLOW_KEYS),
+    ("COMMON_PHRASES", COMMON_PHRASES, COMMON_ERROR_KEYS),
+]
+
+CASES = [
+    pytest.param(labels_dict, key, lang, id=f"{name}-{key}-{lang}")
+    for name, labels_dict, keys in LABEL_SETS
+    for key in keys
+    for lang in LANGUAGES
+]
+
+
+@pytest.mark.parametrize("labels_dict,key,lang", CASES)
+def test_label_has_content(labels_dict, key, lang):
+    """Each label is translated and is not just the key fallback."""
+    assert is_translated(get_label(labels_dict, key, lang), key)
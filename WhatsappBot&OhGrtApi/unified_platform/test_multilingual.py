@@ -19,25 +19,10 @@ from common.i18n.responses import (
     get_subscription_label,
     get_phrase,
 )
-
-# Languages to test
-LANGUAGES = ["en", "hi", "bn", "ta", "te", "kn", "ml", "gu", "mr", "pa", "or"]
-
-LANGUAGE_NAMES = {
-    "en": "English",
-    "hi": "Hindi",
-    "bn": "Bengali",
-    "ta": "Tamil",
-    "te": "Telugu",
-    "kn": "Kannada",
-    "ml": "Malayalam",
-    "gu": "Gujarati",
-    "mr": "Marathi",
-    "pa": "Punjabi",
-    "or": "Odia",
-}
+from multilingual_test_helpers import LANGUAGE_NAMES, LANGUAGES, buffered_output, truncate
 
 
+@buffered_output
 def test_word_game_labels():
     """Test word game labels for all languages."""
     print("\n" + "="*60)
@@ -53,7 +38,7 @@ def test_word_game_labels():
             label = get_word_game_label(key, lang)
             # Check if it's not returning the key itself (fallback)
             is_translated = label != key and len(label) > 0
-            lang_results.append((key, is_translated, label[:50] if len(label) > 50 else label))
+            lang_results.append((key, is_translated, truncate(label, 50)))
 
         all_passed = all(r[1] for r in lang_results)
         status = "✅ PASS" if all_passed else "❌ FAIL"
@@ -67,6 +52,7 @@ def test_word_game_labels():
     return results
 
 
+@buffered_output
 def test_event_labels():
     """Test event labels for all languages."""
     print("\n" + "="*60)
@@ -93,9 +79,9 @@ def test_event_labels():
                     label = get_event_label(key, lang)
 
                 is_translated = label != key and len(label) > 0
-                lang_results.append((key, is_translated, label[:40] if len(label) > 40 else label))
+                lang_results.append((key, is_translated, truncate(label, 40)))
             except Exception as e:
-                lang_results.append((key, False, f"ERROR: {str(e)[:30]}"))
+                lang_results.append((key, False, f"ERROR: {truncate(str(e), 30)}"))
 
         all_passed = all(r[1] for r in lang_results)
         status = "✅ PASS" if all_passed else "❌ FAIL"
@@ -109,6 +95,7 @@ def test_event_labels():
     return results
 
 
+@buffered_output
 def test_local_search_labels():
     """Test local search labels for all languages."""
     print("\n" + "="*60)
@@ -136,9 +123,9 @@ def test_local_search_labels():
                     label = get_local_search_label(key, lang)
 
                 is_translated = label != key and len(label) > 0
-                lang_results.append((key, is_translated, label[:40] if len(label) > 40 else label))
+                lang_results.append((key, is_translated, truncate(label, 40)))
             except Exception as e:
-                lang_results.append((key, False, f"ERROR: {str(e)[:30]}"))
+                lang_results.append((key, False, f"ERROR: {truncate(str(e), 30)}"))
 
         all_passed = all(r[1] for r in lang_results)
         status = "✅ PASS" if all_passed else "❌ FAIL"
@@ -152,6 +139,7 @@ def test_local_search_labels():
     return results
 
 
+@buffered_output
 def test_food_labels():
     """Test food labels for all languages."""
     print("\n" + "="*60)
@@ -167,9 +155,9 @@ def test_food_labels():
             try:
                 label = get_food_label(key, lang)
                 is_translated = label != key and len(label) > 0
-                lang_results.append((key, is_translated, label[:40] if len(label) > 40 else label))
+                lang_results.append((key, is_translated, truncate(label, 40)))
             except Exception as e:
-                lang_results.append((key, False, f"ERROR: {str(e)[:30]}"))
+                lang_results.append((key, False, f"ERROR: {truncate(str(e), 30)}"))
 
         all_passed = all(r[1] for r in lang_results)
         status = "✅ PASS" if all_passed else "❌ FAIL"
@@ -183,6 +171,7 @@ def test_food_labels():
     return results
 
 
+@buffered_output
 def test_subscription_labels():
     """Test subscription labels for all languages."""
     print("\n" + "="*60)
@@ -201,9 +190,9 @@ def test_subscription_labels():
             try:
                 label = get_subscription_label(key, lang)
                 is_translated = label != key and len(label) > 0
-                lang_results.append((key, is_translated, label[:40] if len(label) > 40 else label))
+                lang_results.append((key, is_translated, truncate(label, 40)))
             except Exception as e:
-                lang_results.append((key, False, f"ERROR: {str(e)[:30]}"))
+                lang_results.append((key, False, f"ERROR: {truncate(str(e), 30)}"))
 
         all_passed = all(r[1] for r in lang_results)
         status = "✅ PASS" if all_passed else "❌ FAIL"
@@ -217,6 +206,7 @@ def test_subscription_labels():
     return results
 
 
+@buffered_output
 def test_common_phrases():
     """Test common phrases for all languages."""
     print("\n" + "="*60)
@@ -232,9 +222,9 @@ def test_common_phrases():
             try:
                 label = get_phrase(key, lang)
                 is_translated = label != key and len(label) > 0
-                lang_results.append((key, is_translated, label[:40] if len(label) > 40 else label))
+                lang_results.append((key, is_translated, truncate(label, 40)))
             except Exception as e:
-                lang_results.append((key, False, f"ERROR: {str(e)[:30]}"))
+                lang_results.append((key, False, f"ERROR: {truncate(str(e), 30)}"))
 
         all_passed = all(r[1] for r in lang_results)
         status = "✅ PASS" if all_passed else "❌ FAIL"
@@ -248,6 +238,7 @@ def test_common_phrases():
     return results
 
 
+@buffered_output
 def print_summary(all_results: Dict[str, List[Tuple[str, bool]]]):
     """Print summary of all test results."""
     print("\n" + "="*60)
@@ -6,43 +6,35 @@ Directly imports the responses module without dependencies.
 import sys
 sys.path.insert(0, "/Users/rishi/Desktop/WorkSpace/AIBot/WhatsappBot&OhGrtApi/unified_platform")
 
-# Read and exec the labels directly from responses.py
-import re
-
-responses_path = "/Users/rishi/Desktop/WorkSpace/AIBot/WhatsappBot&OhGrtApi/unified_platform/common/i18n/responses.py"
-with open(responses_path, 'r') as f:
-    content = f.read()
-
-# Execute to get the dictionaries
-exec_globals = {}
-exec(content, exec_globals)
+from multilingual_test_helpers import (
+    LANGUAGE_NAMES,
+    LANGUAGES,
+    buffered_output,
+    completeness_report,
+    load_labels,
+    truncate,
+)
+
+# Load the label dictionaries from responses.py
+LABELS = load_labels((
+    "WORD_GAME_LABELS",
+    "EVENT_LABELS",
+    "LOCAL_SEARCH_LABELS",
+    "FOOD_LABELS",
+    "SUBSCRIPTION_LABELS",
+    "COMMON_PHRASES",
+))
 
 # Get all label dictionaries
-WORD_GAME_LABELS = exec_globals.get('WORD_GAME_LABELS', {})
-EVENT_LABELS = exec_globals.get('EVENT_LABELS', {})
-LOCAL_SEARCH_LABELS = exec_globals.get('LOCAL_SEARCH_LABELS', {})
-FOOD_LABELS = exec_globals.get('FOOD_LABELS', {})
-SUBSCRIPTION_LABELS = exec_globals.get('SUBSCRIPTION_LABELS', {})
-COMMON_PHRASES = exec_globals.get('COMMON_PHRASES', {})
-
-# Languages to test
-LANGUAGES = ["en", "hi", "bn", "ta", "te", "kn", "ml", "gu", "mr", "pa", "or"]
-
-LANGUAGE_NAMES = {
-    "en": "English",
-    "hi": "Hindi",
-    "bn": "Bengali",
-    "ta": "Tamil",
-    "te": "Telugu",
-    "kn": "Kannada",
-    "ml": "Malayalam",
-    "gu": "Gujarati",
-    "mr": "Marathi",
-    "pa": "Punjabi",
-    "or": "Odia",
-}
+WORD_GAME_LABELS = LABELS.get('WORD_GAME_LABELS', {})
+EVENT_LABELS = LABELS.get('EVENT_LABELS', {})
+LOCAL_SEARCH_LABELS = LABELS.get('LOCAL_SEARCH_LABELS', {})
+FOOD_LABELS = LABELS.get('FOOD_LABELS', {})
+SUBSCRIPTION_LABELS = LABELS.get('SUBSCRIPTION_LABELS', {})
+COMMON_PHRASES = LABELS.get('COMMON_PHRASES', {})
 
 
+@buffered_output
 def test_labels(name: str, labels_dict: dict, required_keys: list):
     """Test a label dictionary for all languages."""
     print(f"\n{'='*60}")
@@ -50,32 +42,24 @@ def test_labels(name: str, labels_dict: dict, required_keys: list):
     print(f"{'='*60}")
 
     all_passed = True
+    report = completeness_report(labels_dict, required_keys)
 
     for lang in LANGUAGES:
-        if lang not in labels_dict:
+        missing_keys = report[lang]
+        if missing_keys is None:
             print(f"\n{LANGUAGE_NAMES[lang]} ({lang}): ❌ MISSING LANGUAGE")
             all_passed = False
             continue
 
-        lang_labels = labels_dict[lang]
-        missing_keys = []
-        found_keys = []
-
-        for key in required_keys:
-            if key in lang_labels and lang_labels[key]:
-                found_keys.append(key)
-            else:
-                missing_keys.append(key)
-
         if missing_keys:
             print(f"\n{LANGUAGE_NAMES[lang]} ({lang}): ❌ FAIL")
             print(f"  Missing keys: {missing_keys}")
             all_passed = False
         else:
-            print(f"\n{LANGUAGE_NAMES[lang]} ({lang}): ✅ PASS ({len(found_keys)} keys)")
+            print(f"\n{LANGUAGE_NAMES[lang]} ({lang}): ✅ PASS ({len(required_keys)} keys)")
             # Show a sample translation
             sample_key = required_keys[0]
-            sample_val = lang_labels.get(sample_key, "")[:50]
+            sample_val = truncate(labels_dict[lang].get(sample_key, ""), 50)
             print(f"  Sample ({sample_key}): {sample_val}")
 
     return all_passed
@@ -3,20 +3,12 @@ Sample response generator for all languages.
 Shows how responses look in each of the 11 supported languages.
 """
 
+import importlib.util
 import sys
-sys.path.insert(0, "/Users/rishi/Desktop/WorkSpace/AIBot/WhatsappBot&OhGrtApi/unified_platform")
+from functools import cache, lru_cache
+from pathlib import Path
 
-# Read responses.py directly
-responses_path = "/Users/rishi/Desktop/WorkSpace/AIBot/WhatsappBot&OhGrtApi/unified_platform/common/i18n/responses.py"
-with open(responses_path, 'r') as f:
-    content = f.read()
-
-exec_globals = {}
-exec(content, exec_globals)
-
-WORD_GAME_LABELS = exec_globals.get('WORD_GAME_LABELS', {})
-EVENT_LABELS = exec_globals.get('EVENT_LABELS', {})
-LOCAL_SEARCH_LABELS = exec_globals.get('LOCAL_SEARCH_LABELS', {})
+RESPONSES_PATH = Path(__file__).resolve().parent / "common" / "i18n" / "responses.py"
 
 LANGUAGES = ["en", "hi", "bn", "ta", "te", "kn", "ml", "gu", "mr", "pa", "or"]
 LANGUAGE_NAMES = {
@@ -26,18 +18,65 @@ LANGUAGE_NAMES = {
 }
 
 
-def format_events_response_sample(lang: str) -> str:
-    """Generate a sample events response in the given language."""
-    labels = EVENT_LABELS.get(lang, EVENT_LABELS["en"])
-
-    found = labels.get("found", "Found {count} events").format(count=3)
-    at = labels.get("at", "at")
-    and_more = labels.get("and_more", "...and {count} more").format(count=2)
-    more_details = labels.get("more_details", "Reply with the event number for more details!")
-
-    response = f"""🎫 *{found}:*
-
-*1. Coldplay Music of the Spheres World Tour*
+@cache
+def load_sample_labels() -> dict:
+    """
+    Load responses.py and look up the label values the samples use.
+
+    Runs on first use rather than at import, so importing this module (e.g.
+    during test collection) doesn't load the responses file. Labels are
+    looked up (and formatted) once per language.
+    """
+    # Load responses.py directly as a standalone module; unlike exec() of its
+    # source, the loader reuses the compiled bytecode in __pycache__
+    spec = importlib.util.spec_from_file_location("responses", RESPONSES_PATH)
+    responses = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(responses)
+
+    event_labels = getattr(responses, 'EVENT_LABELS', {})
+    local_search_labels = getattr(responses, 'LOCAL_SEARCH_LABELS', {})
+    word_game_labels = getattr(responses, 'WORD_GAME_LABELS', {})
+
+    return {
+        "events": {
+            lang: {
+                "found": labels.get("found", "Found {count} events").format(count=3),
+                "at": labels.get("at", "at"),
+                "and_more": labels.get("and_more", "...and {count} more").format(count=2),
+                "more_details": labels.get("more_details", "Reply with the event number for more details!"),
+                "ipl_title": labels.get("ipl_title", "IPL 2025 Matches"),
+                "ticket_details": labels.get("ticket_details", "Reply with match number for ticket details!"),
+            }
+            for lang, labels in event_labels.items()
+        },
+        "local_search": {
+            lang: {
+                "found_places": labels.get("found_places", "Found these places"),
+                "away": labels.get("away", "away"),
+                "reviews": labels.get("reviews", "reviews"),
+            }
+            for lang, labels in local_search_labels.items()
+        },
+        "word_game": {
+            lang: {
+                "start": labels.get("start", "Let's play a word game! Unscramble this word:"),
+                "correct": labels.get("correct", "Correct! The word was *{word}*. Well done!").format(word="PINEAPPLE"),
+                "play_again": labels.get("play_again", "Type 'word game' to play again."),
+            }
+            for lang, labels in word_game_labels.items()
+        },
+    }
+
+
+def sample_labels(table: str, lang: str) -> dict:
+    """Get one language's sample labels with fallback to English."""
+    labels = load_sample_labels()[table]
+    return labels.get(lang, labels["en"])
+
+
+# Static sample listings, pre-split at each translated label so a response
+# is just the label joined between the constant fragments
+EVENTS_LISTING = """*1. Coldplay Music of the Spheres World Tour*
 📍 DY Patil Stadium, Mumbai
 📅 January 21, 2025 {at} 7:00 PM
 💰 ₹2,500 - ₹35,000
@@ -50,26 +89,9 @@ def format_events_response_sample(lang: str) -> str:
 *3. Zakir Khan Live*
 📍 Phoenix Marketcity, Bengaluru
 📅 February 15, 2025 {at} 8:00 PM
-💰 ₹999 - ₹2,999
-
-_{and_more}_
-
-📱 {more_details}"""
+💰 ₹999 - ₹2,999""".split("{at}")
 
-    return response
-
-
-def format_ipl_response_sample(lang: str) -> str:
-    """Generate a sample IPL response in the given language."""
-    labels = EVENT_LABELS.get(lang, EVENT_LABELS["en"])
-
-    ipl_title = labels.get("ipl_title", "IPL 2025 Matches")
-    at = labels.get("at", "at")
-    ticket_details = labels.get("ticket_details", "Reply with match number for ticket details!")
-
-    response = f"""🏏 *{ipl_title}:*
-
-*1. Royal Challengers Bengaluru vs Chennai Super Kings*
+IPL_LISTING = """*1. Royal Challengers Bengaluru vs Chennai Super Kings*
 📍 M. Chinnaswamy Stadium, Bengaluru
 📅 March 22, 2025 {at} 7:30 PM
 💰 ₹800 - ₹25,000
@@ -77,26 +99,9 @@ def format_ipl_response_sample(lang: str) -> str:
 *2. Mumbai Indians vs Kolkata Knight Riders*
 📍 Wankhede Stadium, Mumbai
 📅 March 25, 2025 {at} 7:30 PM
-💰 ₹750 - ₹22,000
-
-🎟️ {ticket_details}"""
-
-    return response
-
-
-def format_local_search_sample(lang: str) -> str:
-    """Generate a sample local search response in the given language."""
-    labels = LOCAL_SEARCH_LABELS.get(lang, LOCAL_SEARCH_LABELS["en"])
-
-    found_places = labels.get("found_places", "Found these places")
-    away = labels.get("away", "away")
-    reviews = labels.get("reviews", "reviews")
+💰 ₹750 - ₹22,000""".split("{at}")
 
-    response = f"""*Restaurants near Koramangala*
-
-*{found_places}:*
-
-1. *Toit Brewpub*
+PLACES_LISTING = [part.split("{reviews}") for part in """1. *Toit Brewpub*
    _Microbrewery_
    📏 0.3 km {away}
    📍 100 Feet Road, Koramangala
@@ -115,84 +120,84 @@ def format_local_search_sample(lang: str) -> str:
    📏 0.8 km {away}
    📍 Church Street, Koramangala
    ⭐⭐⭐⭐ 4.1 (5,600 {reviews})
-   📞 +91 80 4112 3456"""
+   📞 +91 80 4112 3456""".split("{away}")]
 
-    return response
 
+@lru_cache(maxsize=16)
+def format_events_response_sample(lang: str) -> str:
+    """Generate a sample events response in the given language."""
+    labels = sample_labels("events", lang)
 
-def format_word_game_sample(lang: str) -> str:
-    """Generate a sample word game response in the given language."""
-    labels = WORD_GAME_LABELS.get(lang, WORD_GAME_LABELS["en"])
+    found = labels["found"]
+    at = labels["at"]
+    and_more = labels["and_more"]
+    more_details = labels["more_details"]
 
-    start = labels.get("start", "Let's play a word game! Unscramble this word:")
+    return f"🎫 *{found}:*\n\n{at.join(EVENTS_LISTING)}\n\n_{and_more}_\n\n📱 {more_details}"
 
-    response = f"""{start}
 
-*PPAELNIS*"""
+@lru_cache(maxsize=16)
+def format_ipl_response_sample(lang: str) -> str:
+    """Generate a sample IPL response in the given language."""
+    labels = sample_labels("events", lang)
 
-    return response
+    ipl_title = labels["ipl_title"]
+    at = labels["at"]
+    ticket_details = labels["ticket_details"]
 
+    return f"🏏 *{ipl_title}:*\n\n{at.join(IPL_LISTING)}\n\n🎟️ {ticket_details}"
 
-def format_word_game_correct_sample(lang: str) -> str:
-    """Generate a sample word game correct response in the given language."""
-    labels = WORD_GAME_LABELS.get(lang, WORD_GAME_LABELS["en"])
 
-    correct = labels.get("correct", "Correct! The word was *{word}*. Well done!").format(word="PINEAPPLE")
-    play_again = labels.get("play_again", "Type 'word game' to play again.")
+@lru_cache(maxsize=16)
+def format_local_search_sample(lang: str) -> str:
+    """Generate a sample local search response in the given language."""
+    labels = sample_labels("local_search", lang)
+
+    found_places = labels["found_places"]
+    away = labels["away"]
+    reviews = labels["reviews"]
 
-    response = f"""{correct}
+    listing = away.join(reviews.join(parts) for parts in PLACES_LISTING)
+    return f"*Restaurants near Koramangala*\n\n*{found_places}:*\n\n{listing}"
 
-{play_again}"""
 
-    return response
+@lru_cache(maxsize=16)
+def format_word_game_sample(lang: str) -> str:
+    """Generate a sample word game response in the given language."""
+    labels = sample_labels("word_game", lang)
 
+    return f"{labels['start']}\n\n*PPAELNIS*"
 
-def main():
-    print("="*70)
-    print("SAMPLE RESPONSES IN ALL 11 LANGUAGES")
-    print("="*70)
 
+@lru_cache(maxsize=16)
+def format_word_game_correct_sample(lang: str) -> str:
+    """Generate a sample word game correct response in the given language."""
+    labels = sample_labels("word_game", lang)
+
+    return f"{labels['correct']}\n\n{labels['play_again']}"
+
+
+def main():
     # Select a few key languages to show samples
     sample_langs = ["en", "hi", "ta", "bn", "kn"]
 
-    print("\n" + "="*70)
-    print("1. WORD GAME - Start")
-    print("="*70)
-    for lang in sample_langs:
-        print(f"\n--- {LANGUAGE_NAMES[lang]} ({lang}) ---")
-        print(format_word_game_sample(lang))
-
-    print("\n" + "="*70)
-    print("2. WORD GAME - Correct Answer")
-    print("="*70)
-    for lang in sample_langs:
-        print(f"\n--- {LANGUAGE_NAMES[lang]} ({lang}) ---")
-        print(format_word_game_correct_sample(lang))
-
-    print("\n" + "="*70)
-    print("3. EVENTS - Found Events")
-    print("="*70)
-    for lang in sample_langs:
-        print(f"\n--- {LANGUAGE_NAMES[lang]} ({lang}) ---")
-        print(format_events_response_sample(lang))
-
-    print("\n" + "="*70)
-    print("4. IPL MATCHES")
-    print("="*70)
-    for lang in sample_langs:
-        print(f"\n--- {LANGUAGE_NAMES[lang]} ({lang}) ---")
-        print(format_ipl_response_sample(lang))
-
-    print("\n" + "="*70)
-    print("5. LOCAL SEARCH - Restaurants")
-    print("="*70)
-    for lang in sample_langs:
-        print(f"\n--- {LANGUAGE_NAMES[lang]} ({lang}) ---")
-        print(format_local_search_sample(lang))
-
-    print("\n" + "="*70)
-    print("ALL SAMPLE RESPONSES GENERATED SUCCESSFULLY!")
-    print("="*70)
+    sections = [
+        ("1. WORD GAME - Start", format_word_game_sample),
+        ("2. WORD GAME - Correct Answer", format_word_game_correct_sample),
+        ("3. EVENTS - Found Events", format_events_response_sample),
+        ("4. IPL MATCHES", format_ipl_response_sample),
+        ("5. LOCAL SEARCH - Restaurants", format_local_search_sample),
+    ]
+
+    # Collect the whole report and write it in one go
+    lines = ["="*70, "SAMPLE RESPONSES IN ALL 11 LANGUAGES", "="*70]
+    for title, format_sample in sections:
+        lines += ["\n" + "="*70, title, "="*70]
+        for lang in sample_langs:
+            lines += [f"\n--- {LANGUAGE_NAMES[lang]} ({lang}) ---", format_sample(lang)]
+    lines += ["\n" + "="*70, "ALL SAMPLE RESPONSES GENERATED SUCCESSFULLY!", "="*70]
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
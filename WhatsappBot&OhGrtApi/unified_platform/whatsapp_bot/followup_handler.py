@@ -16,9 +16,11 @@ Best Practices Implemented:
 """
 
 import re
+import sys
 import logging
 from typing import Optional, Dict, Any, Tuple, List
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -36,7 +38,7 @@ class FollowupType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FollowupAnalysis:
     """Result of follow-up analysis."""
     followup_type: FollowupType
@@ -51,7 +53,7 @@ class FollowupAnalysis:
 # CONTINUATION PHRASES (Multi-language)
 # =============================================================================
 
-CONTINUATION_PHRASES = {
+_CONTINUATION_PHRASE_LISTS = {
     # English
     "en": {
         "topic_continuation": [
@@ -131,6 +133,32 @@ CONTINUATION_PHRASES = {
     },
 }
 
+# Freeze the phrase lists into interned tuples, longest phrase first, so no
+# caller can mutate them and longer phrases ("yes please") are tried before
+# their prefixes ("yes")
+CONTINUATION_PHRASES = {
+    lang: {
+        category: tuple(
+            sys.intern(phrase) for phrase in sorted(phrases, key=len, reverse=True)
+        )
+        for category, phrases in categories.items()
+    }
+    for lang, categories in _CONTINUATION_PHRASE_LISTS.items()
+}
+
+# Each language's phrases plus the English ones, keyed flat by
+# (language, category). Duplicates are dropped and the merge is kept longest
+# first, so "yes please" wins over "yes" wherever both would match.
+_FLAT_PHRASES = {
+    (lang, category): tuple(sorted(
+        dict.fromkeys(categories.get(category, ()) + english_phrases),
+        key=len,
+        reverse=True,
+    ))
+    for lang, categories in CONTINUATION_PHRASES.items()
+    for category, english_phrases in CONTINUATION_PHRASES["en"].items()
+}
+
 # Topics that can continue from each other
 RELATED_TOPICS = {
     "life_prediction": ["marriage", "career", "health", "wealth", "children", "foreign"],
@@ -147,6 +175,19 @@ ENTITY_PATTERNS = {
     "prediction_type": r"(marriage|career|health|wealth|children|foreign|shaadi|naukri|dhan|santan|videsh)",
 }
 
+# Patterns for pulling the asked-about topic out of a continuation; like
+# ENTITY_PATTERNS they are lowercase and run on the lowercased message
+TOPIC_REFERENCE_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"what about (?:my )?(\w+)",
+        r"how about (?:my )?(\w+)",
+        r"tell me about (?:my )?(\w+)",
+        r"(\w+) ke baare mein",  # Hindi
+        r"aur (\w+)",  # Hindi
+    )
+)
+
 
 # =============================================================================
 # FOLLOW-UP ANALYZER
@@ -165,14 +206,94 @@ class FollowupAnalyzer:
 
     def __init__(self):
         self._compile_patterns()
+        # The analysis only depends on the normalized message, the language
+        # and whether any context exists, so repeated short replies ("yes",
+        # "ok", "haan") are answered from this cache
+        self._analyze_cached = lru_cache(maxsize=4096)(self._analyze)
+
+        # Single-word yes/no replies are the most common follow-ups; their
+        # results are built once here and returned without any matching.
+        # Only replies that come out the same with or without context are
+        # kept, as the lookup below skips the context check.
+        self._instant_results = {}
+        for (lang, category), phrases in _FLAT_PHRASES.items():
+            if category not in ("confirmation", "negation"):
+                continue
+            for reply in phrases:
+                result = self._analyze(reply, lang, False)
+                if " " not in reply and result == self._analyze(reply, lang, True):
+                    self._instant_results[(lang, reply)] = result
 
     def _compile_patterns(self):
         """Compile regex patterns for efficiency."""
-        self._entity_patterns = {
-            name: re.compile(pattern, re.IGNORECASE)
-            for name, pattern in ENTITY_PATTERNS.items()
+        # First letters of every phrase a language can match, for a cheap
+        # check that any continuation phrase could occur at all
+        self._phrase_initials = {
+            lang: frozenset(
+                phrase[0]
+                for (phrase_lang, _), phrases in _FLAT_PHRASES.items()
+                if phrase_lang == lang
+                for phrase in phrases
+            )
+            for lang in CONTINUATION_PHRASES
+        }
+
+        # One master regex per (language, has_context) covering every check,
+        # plus phrase-free ones for messages no phrase can occur in
+        self._masters = {
+            (lang, has_context): self._build_master(lang, has_context)
+            for lang in CONTINUATION_PHRASES
+            for has_context in (False, True)
+        }
+        self._entity_masters = {
+            has_context: self._build_master(None, has_context)
+            for has_context in (False, True)
         }
 
+    @staticmethod
+    def _build_master(
+        lang: Optional[str],
+        has_context: bool
+    ) -> "re.Pattern[str]":
+        """
+        Compile all follow-up checks into one regex, in priority order.
+
+        The regex is matched at the start of the message and each branch
+        lazily scans ahead for its own patterns, so an earlier branch wins
+        whenever it matches anywhere - the order the checks used to run in
+        one after another. The named group that matched tells which check
+        fired. Everything is lowercase, as analyze() lowercases the message,
+        so no case folding is needed at match time. Without a language only
+        the entity checks are compiled.
+        """
+        def alternation(category: str) -> str:
+            return "|".join(map(re.escape, _FLAT_PHRASES[(lang, category)]))
+
+        branches = []
+        if lang:
+            branches.append(
+                rf"(?s:.*?)(?P<topic_continuation>{alternation('topic_continuation')})"
+            )
+        if has_context:
+            # A prediction type alone continues the current topic
+            branches.append(
+                rf"(?s:.*?)(?P<implicit_topic>{ENTITY_PATTERNS['prediction_type']})"
+            )
+        if lang:
+            branches += [
+                rf"(?s:.*?)(?P<clarification>{alternation('clarification')})",
+                # At the start of the message or of a word
+                rf"(?s:.*?)(?:^| )(?P<elaboration>{alternation('elaboration')})",
+                # The whole message, or its leading words
+                rf"(?P<confirmation>{alternation('confirmation')})(?= |\Z)",
+                rf"(?P<negation>{alternation('negation')})(?= |\Z)",
+            ]
+        branches += [
+            rf"(?s:.*?)(?P<{name}>{pattern})"
+            for name, pattern in ENTITY_PATTERNS.items()
+        ]
+        return re.compile("|".join(branches))
+
     def analyze(
         self,
         message: str,
@@ -191,34 +312,34 @@ class FollowupAnalyzer:
             FollowupAnalysis with recommendations
         """
         message_lower = message.lower().strip()
+        result = self._instant_results.get((language, message_lower))
+        if result is not None:
+            return result
+        return self._analyze_cached(message_lower, language, bool(context))
 
-        # Check for topic continuation
-        topic_result = self._check_topic_continuation(message_lower, context, language)
-        if topic_result:
-            return topic_result
-
-        # Check for clarification requests
-        clarification_result = self._check_clarification(message_lower, context, language)
-        if clarification_result:
-            return clarification_result
-
-        # Check for elaboration requests
-        elaboration_result = self._check_elaboration(message_lower, context, language)
-        if elaboration_result:
-            return elaboration_result
+    def _analyze(
+        self,
+        message_lower: str,
+        language: str,
+        has_context: bool
+    ) -> FollowupAnalysis:
+        """Analyze a normalized message; results are shared, so never mutated."""
+        lang = language if language in self._phrase_initials else "en"
 
-        # Check for confirmation/negation
-        confirm_result = self._check_confirmation(message_lower, language)
-        if confirm_result:
-            return confirm_result
+        # A continuation phrase can only occur in a message that contains its
+        # first letter; native-script text usually shares none with the
+        # romanized phrases, so it only needs the entity patterns
+        if self._phrase_initials[lang].isdisjoint(message_lower):
+            master = self._entity_masters[has_context]
+        else:
+            master = self._masters[(lang, has_context)]
 
-        # Check for entity references
-        entity_result = self._check_entity_reference(message_lower, context)
-        if entity_result:
-            return entity_result
+        match = master.match(message_lower)
+        if match:
+            return self._result_for(match.lastgroup, match.group(match.lastgroup), message_lower)
 
         # Default: treat as new topic if context exists but no match
-        if context:
+        if has_context:
             return FollowupAnalysis(
                 followup_type=FollowupType.NEW_TOPIC,
                 should_use_context=False,
@@ -233,152 +354,64 @@ class FollowupAnalyzer:
             reason="no_context_available"
         )
 
-    def _check_topic_continuation(
-        self,
-        message: str,
-        context: Optional[Dict],
-        language: str
-    ) -> Optional[FollowupAnalysis]:
-        """Check if message is continuing a topic."""
-        phrases = CONTINUATION_PHRASES.get(language, {}).get("topic_continuation", [])
-        phrases.extend(CONTINUATION_PHRASES.get("en", {}).get("topic_continuation", []))
-
-        for phrase in phrases:
-            if phrase in message:
+    def _result_for(self, kind: str, text: str, message: str) -> FollowupAnalysis:
+        """Build the analysis for the master regex branch that matched."""
+        if kind == "topic_continuation":
+            return FollowupAnalysis(
+                followup_type=FollowupType.TOPIC_CONTINUATION,
+                should_use_context=True,
                 # Extract what they're asking about
-                referenced = self._extract_topic_reference(message)
-
-                return FollowupAnalysis(
-                    followup_type=FollowupType.TOPIC_CONTINUATION,
-                    should_use_context=True,
-                    referenced_topic=referenced,
-                    confidence=0.85,
-                    reason=f"continuation_phrase:{phrase}"
-                )
-
-        # Check for prediction type mentions (implicit continuation)
-        for pattern_name, pattern in self._entity_patterns.items():
-            if pattern_name == "prediction_type":
-                match = pattern.search(message)
-                if match and context:
-                    return FollowupAnalysis(
-                        followup_type=FollowupType.TOPIC_CONTINUATION,
-                        should_use_context=True,
-                        referenced_entity=match.group(1),
-                        confidence=0.75,
-                        reason=f"implicit_topic_reference:{match.group(1)}"
-                    )
-
-        return None
-
-    def _check_clarification(
-        self,
-        message: str,
-        context: Optional[Dict],
-        language: str
-    ) -> Optional[FollowupAnalysis]:
-        """Check if message is asking for clarification."""
-        phrases = CONTINUATION_PHRASES.get(language, {}).get("clarification", [])
-        phrases.extend(CONTINUATION_PHRASES.get("en", {}).get("clarification", []))
-
-        for phrase in phrases:
-            if phrase in message:
-                return FollowupAnalysis(
-                    followup_type=FollowupType.CLARIFICATION,
-                    should_use_context=True,
-                    confidence=0.9,
-                    reason=f"clarification_phrase:{phrase}"
-                )
-
-        return None
-
-    def _check_elaboration(
-        self,
-        message: str,
-        context: Optional[Dict],
-        language: str
-    ) -> Optional[FollowupAnalysis]:
-        """Check if message is asking for elaboration."""
-        phrases = CONTINUATION_PHRASES.get(language, {}).get("elaboration", [])
-        phrases.extend(CONTINUATION_PHRASES.get("en", {}).get("elaboration", []))
-
-        for phrase in phrases:
-            if message.startswith(phrase) or f" {phrase}" in message:
-                return FollowupAnalysis(
-                    followup_type=FollowupType.ELABORATION,
-                    should_use_context=True,
-                    confidence=0.85,
-                    reason=f"elaboration_phrase:{phrase}"
-                )
+                referenced_topic=self._extract_topic_reference(message),
+                confidence=0.85,
+                reason=f"continuation_phrase:{text}"
+            )
 
-        return None
+        if kind == "implicit_topic":
+            return FollowupAnalysis(
+                followup_type=FollowupType.TOPIC_CONTINUATION,
+                should_use_context=True,
+                referenced_entity=text,
+                confidence=0.75,
+                reason=f"implicit_topic_reference:{text}"
+            )
 
-    def _check_confirmation(
-        self,
-        message: str,
-        language: str
-    ) -> Optional[FollowupAnalysis]:
-        """Check if message is confirmation or negation."""
-        # Check confirmation
-        confirm_phrases = CONTINUATION_PHRASES.get(language, {}).get("confirmation", [])
-        confirm_phrases.extend(CONTINUATION_PHRASES.get("en", {}).get("confirmation", []))
-
-        for phrase in confirm_phrases:
-            if message == phrase or message.startswith(f"{phrase} "):
-                return FollowupAnalysis(
-                    followup_type=FollowupType.CONFIRMATION,
-                    should_use_context=True,
-                    confidence=0.95,
-                    reason=f"confirmation:{phrase}"
-                )
-
-        # Check negation
-        negate_phrases = CONTINUATION_PHRASES.get(language, {}).get("negation", [])
-        negate_phrases.extend(CONTINUATION_PHRASES.get("en", {}).get("negation", []))
-
-        for phrase in negate_phrases:
-            if message == phrase or message.startswith(f"{phrase} "):
-                return FollowupAnalysis(
-                    followup_type=FollowupType.NEGATION,
-                    should_use_context=True,
-                    confidence=0.95,
-                    reason=f"negation:{phrase}"
-                )
+        if kind == "clarification":
+            return FollowupAnalysis(
+                followup_type=FollowupType.CLARIFICATION,
+                should_use_context=True,
+                confidence=0.9,
+                reason=f"clarification_phrase:{text}"
+            )
 
-        return None
+        if kind == "elaboration":
+            return FollowupAnalysis(
+                followup_type=FollowupType.ELABORATION,
+                should_use_context=True,
+                confidence=0.85,
+                reason=f"elaboration_phrase:{text}"
+            )
 
-    def _check_entity_reference(
-        self,
-        message: str,
-        context: Optional[Dict]
-    ) -> Optional[FollowupAnalysis]:
-        """Check if message references a specific astrological entity."""
-        for entity_type, pattern in self._entity_patterns.items():
-            match = pattern.search(message)
-            if match:
-                return FollowupAnalysis(
-                    followup_type=FollowupType.ENTITY_REFERENCE,
-                    should_use_context=True,
-                    referenced_entity=match.group(0),
-                    confidence=0.7,
-                    reason=f"entity_reference:{entity_type}:{match.group(0)}"
-                )
+        if kind in ("confirmation", "negation"):
+            return FollowupAnalysis(
+                followup_type=FollowupType(kind),
+                should_use_context=True,
+                confidence=0.95,
+                reason=f"{kind}:{text}"
+            )
 
-        return None
+        # Otherwise one of the ENTITY_PATTERNS matched
+        return FollowupAnalysis(
+            followup_type=FollowupType.ENTITY_REFERENCE,
+            should_use_context=True,
+            referenced_entity=text,
+            confidence=0.7,
+            reason=f"entity_reference:{kind}:{text}"
+        )
 
     def _extract_topic_reference(self, message: str) -> Optional[str]:
         """Extract what topic the user is asking about."""
-        # Common patterns
-        patterns = [
-            r"what about (?:my )?(\w+)",
-            r"how about (?:my )?(\w+)",
-            r"tell me about (?:my )?(\w+)",
-            r"(\w+) ke baare mein",  # Hindi
-            r"aur (\w+)",  # Hindi
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
+        for pattern in TOPIC_REFERENCE_PATTERNS:
+            match = pattern.search(message)
             if match:
                 return match.group(1)
 
@@ -439,6 +472,31 @@ def should_reuse_birth_details(
     return False
 
 
+# Prompts shown for each follow-up type, by language
+FOLLOWUP_PROMPTS = {
+    "en": {
+        FollowupType.TOPIC_CONTINUATION: "Sure, let me tell you about {topic}...",
+        FollowupType.CLARIFICATION: "Let me explain in more detail...",
+        FollowupType.ELABORATION: "Here's why...",
+        FollowupType.CONFIRMATION: "Great, proceeding...",
+        FollowupType.NEGATION: "Okay, let me know if you need anything else.",
+    },
+    "hi": {
+        FollowupType.TOPIC_CONTINUATION: "ज़रूर, मैं आपको {topic} बारे में बताता हूं...",
+        FollowupType.CLARIFICATION: "मैं विस्तार से समझाता हूं...",
+        FollowupType.ELABORATION: "इसका कारण यह है...",
+        FollowupType.CONFIRMATION: "ठीक है, आगे बढ़ते हैं...",
+        FollowupType.NEGATION: "ठीक है, कुछ और चाहिए तो बताइए।",
+    },
+}
+
+# What {topic} reads as when no topic was referenced
+DEFAULT_PROMPT_TOPIC = {
+    "en": "that",
+    "hi": "इसके",
+}
+
+
 def get_followup_prompt(
     followup_type: FollowupType,
     language: str = "en",
@@ -455,25 +513,12 @@ def get_followup_prompt(
     Returns:
         Prompt to show user
     """
-    prompts = {
-        "en": {
-            FollowupType.TOPIC_CONTINUATION: f"Sure, let me tell you about {referenced_topic or 'that'}...",
-            FollowupType.CLARIFICATION: "Let me explain in more detail...",
-            FollowupType.ELABORATION: "Here's why...",
-            FollowupType.CONFIRMATION: "Great, proceeding...",
-            FollowupType.NEGATION: "Okay, let me know if you need anything else.",
-        },
-        "hi": {
-            FollowupType.TOPIC_CONTINUATION: f"ज़रूर, मैं आपको {referenced_topic or 'इसके'} बारे में बताता हूं...",
-            FollowupType.CLARIFICATION: "मैं विस्तार से समझाता हूं...",
-            FollowupType.ELABORATION: "इसका कारण यह है...",
-            FollowupType.CONFIRMATION: "ठीक है, आगे बढ़ते हैं...",
-            FollowupType.NEGATION: "ठीक है, कुछ और चाहिए तो बताइए।",
-        },
-    }
-
-    lang_prompts = prompts.get(language, prompts["en"])
-    return lang_prompts.get(followup_type, "")
+    lang = language if language in FOLLOWUP_PROMPTS else "en"
+    prompt = FOLLOWUP_PROMPTS[lang].get(followup_type, "")
+    # Only the topic continuation prompt has a {topic} to fill in
+    if followup_type is FollowupType.TOPIC_CONTINUATION:
+        return prompt.format(topic=referenced_topic or DEFAULT_PROMPT_TOPIC[lang])
+    return prompt
 
 
 # =============================================================================
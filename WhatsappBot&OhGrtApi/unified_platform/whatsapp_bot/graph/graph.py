@@ -5,15 +5,21 @@ Defines the state graph with conditional routing based on intent detection.
 """
 
 import asyncio
+import hashlib
+import importlib
 import logging
 import re
-from typing import Dict, Literal
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Literal, Optional
 
 from langgraph.graph import StateGraph, START, END
 
 from common.graph.state import BotState, create_state_from_whatsapp
 from common.config.settings import settings as common_settings
-from common.i18n.detector import detect_language
+from common.i18n.constants import SCRIPT_RANGES
+from common.i18n.detector import detect_language, detect_script, script_to_language
 from whatsapp_bot.graph.nodes.intent_v2 import detect_intent
 from common.graph.nodes.chat import handle_chat, handle_fallback
 from common.graph.nodes.weather import handle_weather
@@ -32,69 +38,42 @@ from whatsapp_bot.graph.nodes.image_analysis import handle_image_analysis
 from whatsapp_bot.graph.nodes.reminder import handle_reminder
 from whatsapp_bot.graph.nodes.help import handle_help
 
-# Import new nodes from d23apiv1
-try:
-    from whatsapp_bot.graph.nodes.dosha_node import handle_dosha
-    DOSHA_AVAILABLE = True
-except ImportError:
-    DOSHA_AVAILABLE = False
-    handle_dosha = None
-
-try:
-    from whatsapp_bot.graph.nodes.life_prediction_node import handle_life_prediction
-    LIFE_PREDICTION_AVAILABLE = True
-except ImportError:
-    LIFE_PREDICTION_AVAILABLE = False
-    handle_life_prediction = None
-
-try:
-    from whatsapp_bot.graph.nodes.local_search import handle_local_search
-    LOCAL_SEARCH_AVAILABLE = True
-except ImportError:
-    LOCAL_SEARCH_AVAILABLE = False
-    handle_local_search = None
-
-try:
-    from whatsapp_bot.graph.nodes.metro_ticket import handle_metro_ticket
-    METRO_AVAILABLE = True
-except ImportError:
-    METRO_AVAILABLE = False
-    handle_metro_ticket = None
-
-try:
-    from whatsapp_bot.graph.nodes.word_game import handle_word_game
-    WORD_GAME_AVAILABLE = True
-except ImportError:
-    WORD_GAME_AVAILABLE = False
-    handle_word_game = None
+# Optional nodes from d23apiv1: (node name, module, handler function)
+_OPTIONAL_NODES = (
+    ("dosha", "whatsapp_bot.graph.nodes.dosha_node", "handle_dosha"),
+    ("life_prediction", "whatsapp_bot.graph.nodes.life_prediction_node", "handle_life_prediction"),
+    ("local_search", "whatsapp_bot.graph.nodes.local_search", "handle_local_search"),
+    ("metro_ticket", "whatsapp_bot.graph.nodes.metro_ticket", "handle_metro_ticket"),
+    ("word_game", "whatsapp_bot.graph.nodes.word_game", "handle_word_game"),
+    ("fact_check", "whatsapp_bot.graph.nodes.fact_check", "handle_fact_check"),
+    ("event", "whatsapp_bot.graph.nodes.event_node", "handle_events"),
+    ("food", "whatsapp_bot.graph.nodes.food_node", "handle_food"),
+    ("db_query", "whatsapp_bot.graph.nodes.db_node", "handle_db_query"),
+)
+
+
+def _import_optional_nodes() -> Dict[str, Callable]:
+    """Import the optional node handlers that are available, by node name."""
+    handlers = {}
+    for node, module, handler in _OPTIONAL_NODES:
+        try:
+            handlers[node] = getattr(importlib.import_module(module), handler)
+        except (ImportError, AttributeError):
+            pass
+    return handlers
 
-try:
-    from whatsapp_bot.graph.nodes.fact_check import handle_fact_check
-    FACT_CHECK_AVAILABLE = True
-except ImportError:
-    FACT_CHECK_AVAILABLE = False
-    handle_fact_check = None
 
-try:
-    from whatsapp_bot.graph.nodes.event_node import handle_events as handle_event
-    EVENT_AVAILABLE = True
-except ImportError:
-    EVENT_AVAILABLE = False
-    handle_event = None
+OPTIONAL_NODE_HANDLERS = _import_optional_nodes()
 
-try:
-    from whatsapp_bot.graph.nodes.food_node import handle_food
-    FOOD_AVAILABLE = True
-except ImportError:
-    FOOD_AVAILABLE = False
-    handle_food = None
-
-try:
-    from whatsapp_bot.graph.nodes.db_node import handle_db_query
-    DB_AVAILABLE = True
-except ImportError:
-    DB_AVAILABLE = False
-    handle_db_query = None
+DOSHA_AVAILABLE = "dosha" in OPTIONAL_NODE_HANDLERS
+LIFE_PREDICTION_AVAILABLE = "life_prediction" in OPTIONAL_NODE_HANDLERS
+LOCAL_SEARCH_AVAILABLE = "local_search" in OPTIONAL_NODE_HANDLERS
+METRO_AVAILABLE = "metro_ticket" in OPTIONAL_NODE_HANDLERS
+WORD_GAME_AVAILABLE = "word_game" in OPTIONAL_NODE_HANDLERS
+FACT_CHECK_AVAILABLE = "fact_check" in OPTIONAL_NODE_HANDLERS
+EVENT_AVAILABLE = "event" in OPTIONAL_NODE_HANDLERS
+FOOD_AVAILABLE = "food" in OPTIONAL_NODE_HANDLERS
+DB_AVAILABLE = "db_query" in OPTIONAL_NODE_HANDLERS
 
 logger = logging.getLogger(__name__)
 
@@ -108,42 +87,141 @@ except ImportError:
     AI_LANGUAGE_AVAILABLE = False
 
 
+class _TTLCache:
+    """Small LRU cache whose entries expire ttl seconds after being set."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        # Callers on other threads (process_message_sync) may expire or
+        # evict the same entry concurrently, so neither step may assume the
+        # key is still there
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            pass
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)  # Remove oldest
+
+
+# AI language detection results by message text, so repeated messages
+# ("hi", "ok", menu replies) don't each cost an OpenAI call
+_LANGUAGE_CACHE = _TTLCache(maxsize=10_000, ttl=1800)
+
+# AI translations by (text digest, target language); most bot replies are
+# templated, so the same text is translated again and again
+_TRANSLATION_CACHE = _TTLCache(maxsize=50_000, ttl=86400)
+
+# Translations being fetched right now, by (event loop, cache key), so a burst
+# of identical replies shares one OpenAI call instead of making one each
+_translations_in_flight: Dict[tuple, "asyncio.Task[str]"] = {}
+
+_HINGLISH_TOKEN_RE = re.compile(r"[a-zA-Z']+")
+
+_HINGLISH_HINTS = frozenset({
+    "mujhe", "batao", "ka", "ki", "kya", "kyun", "hai", "nahi", "haan",
+    "kripya", "aap", "tum", "mera", "meri", "hum", "hain", "mein",
+    "kaise", "kab", "kahan", "kaha", "se", "ke", "ko", "mat",
+})
+
+_ZODIAC_HINGLISH = frozenset({
+    "mesh", "vrishabh", "mithun", "kark", "singh", "simha", "kanya",
+    "tula", "vrishchik", "dhanu", "makar", "kumbh", "meen",
+    "rashifal", "rashi",
+})
+
+# ASCII fast path: the table lowercases letters, keeps apostrophes and turns
+# every other byte into a space, so bytes.split() yields the same tokens as
+# _HINGLISH_TOKEN_RE without running the regex engine
+_HINGLISH_TOKEN_TABLE = bytes(
+    ord(chr(byte).lower()) if chr(byte).isalpha() or chr(byte) == "'" else ord(" ")
+    for byte in range(128)
+) + b" " * 128
+_HINGLISH_HINTS_ASCII = frozenset(word.encode() for word in _HINGLISH_HINTS)
+_ZODIAC_HINGLISH_ASCII = frozenset(word.encode() for word in _ZODIAC_HINGLISH)
+
+
 def _looks_like_hinglish(text: str) -> bool:
-    tokens = re.findall(r"[a-zA-Z']+", text.lower())
-    if not tokens:
-        return False
-    hints = {
-        "mujhe", "batao", "ka", "ki", "kya", "kyun", "hai", "nahi", "haan",
-        "kripya", "aap", "tum", "mera", "meri", "hum", "hain", "mein",
-        "kaise", "kab", "kahan", "kaha", "se", "ke", "ko", "mat",
-    }
-    zodiac_hinglish = {
-        "mesh", "vrishabh", "mithun", "kark", "singh", "simha", "kanya",
-        "tula", "vrishchik", "dhanu", "makar", "kumbh", "meen",
-        "rashifal", "rashi",
-    }
-    if any(t in zodiac_hinglish for t in tokens):
-        return True
+    if text.isascii():
+        tokens = text.encode().translate(_HINGLISH_TOKEN_TABLE).split()
+        zodiac, hints = _ZODIAC_HINGLISH_ASCII, _HINGLISH_HINTS_ASCII
+    else:
+        tokens = _HINGLISH_TOKEN_RE.findall(text.lower())
+        zodiac, hints = _ZODIAC_HINGLISH, _HINGLISH_HINTS
+
+    # One pass: any zodiac word, or a second hint word, decides it
+    hint_count = 0
+    for token in tokens:
+        if token in zodiac:
+            return True
+        if token in hints:
+            hint_count += 1
+            if hint_count >= 2:
+                return True
+    return False
+
+
+# Scripts written by a single supported language; Devanagari (Hindi or
+# Marathi), Bengali (Bengali or Assamese) and Arabic are left to the AI
+_SINGLE_LANGUAGE_SCRIPTS = frozenset({
+    "gurmukhi", "gujarati", "oriya", "tamil", "telugu", "kannada", "malayalam",
+})
 
-    return sum(1 for t in tokens if t in hints) >= 2
+
+def _is_mostly_script(text: str, script: str) -> bool:
+    """Whether text has more characters in script than Latin letters."""
+    start, end = SCRIPT_RANGES[script]
+    in_script = sum(1 for char in text if start <= ord(char) <= end)
+    latin = sum(1 for char in text if char.isascii() and char.isalpha())
+    return in_script > latin
 
 
 async def _detect_language(message: str) -> str:
     if not message:
         return "en"
 
-    if AI_LANGUAGE_AVAILABLE and common_settings.OPENAI_API_KEY and ai_understand_message:
-        try:
-            ai_result = await ai_understand_message(
-                message,
-                openai_api_key=common_settings.OPENAI_API_KEY,
-            )
-            detected = ai_result.get("detected_language", "en")
-        except Exception as e:
-            logger.warning(f"AI language detection failed, falling back: {e}")
-            detected = detect_language(message)
+    # Settle the easy cases locally without an OpenAI call: a script only
+    # one language uses, or romanized text with clear Hinglish words
+    if message.isascii():
+        if _looks_like_hinglish(message):
+            return "hi"
     else:
-        detected = detect_language(message)
+        # detect_script ignores Latin letters, so an English sentence with
+        # one Tamil word still needs the AI detector
+        script = detect_script(message)
+        if script in _SINGLE_LANGUAGE_SCRIPTS and _is_mostly_script(message, script):
+            return script_to_language(script)
+
+    detected = _LANGUAGE_CACHE.get(message)
+    if detected is None:
+        if AI_LANGUAGE_AVAILABLE and common_settings.OPENAI_API_KEY and ai_understand_message:
+            try:
+                ai_result = await ai_understand_message(
+                    message,
+                    openai_api_key=common_settings.OPENAI_API_KEY,
+                )
+                detected = ai_result.get("detected_language", "en")
+                _LANGUAGE_CACHE.set(message, detected)
+            except Exception as e:
+                logger.warning("AI language detection failed, falling back: %s", e)
+                detected = detect_language(message)
+        else:
+            detected = detect_language(message)
 
     if detected == "en" and _looks_like_hinglish(message):
         return "hi"
@@ -151,19 +229,55 @@ async def _detect_language(message: str) -> str:
     return detected
 
 
+async def _fetch_translation(text: str, target_lang: str, cache_key: tuple) -> str:
+    translated = await ai_translate_response(
+        text=text,
+        target_language=target_lang,
+        openai_api_key=common_settings.OPENAI_API_KEY,
+    )
+    # The service hands back the original text when translation fails;
+    # don't pin that for a day
+    if translated != text:
+        _TRANSLATION_CACHE.set(cache_key, translated)
+    return translated
+
+
+def _is_likely_lang(text: str, lang: str) -> bool:
+    """Whether text is mostly written in the script of lang already."""
+    script = detect_script(text)
+    if script is None or script_to_language(script) != lang:
+        return False
+    return _is_mostly_script(text, script)
+
+
 async def _translate_response(text: str, target_lang: str) -> str:
     if not text or target_lang == "en":
         return text
 
+    # Replies already written in the target language (e.g. native-script
+    # labels) need no translation call
+    if not text.isascii() and _is_likely_lang(text, target_lang):
+        return text
+
     if AI_LANGUAGE_AVAILABLE and common_settings.OPENAI_API_KEY and ai_translate_response:
+        cache_key = (hashlib.blake2b(text.encode(), digest_size=16).digest(), target_lang)
+        translated = _TRANSLATION_CACHE.get(cache_key)
+        if translated is not None:
+            return translated
+
+        # Join a translation of the same reply that's already under way
+        flight_key = (asyncio.get_running_loop(), cache_key)
+        task = _translations_in_flight.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(_fetch_translation(text, target_lang, cache_key))
+            _translations_in_flight[flight_key] = task
+            task.add_done_callback(lambda _: _translations_in_flight.pop(flight_key, None))
         try:
-            return await ai_translate_response(
-                text=text,
-                target_language=target_lang,
-                openai_api_key=common_settings.OPENAI_API_KEY,
-            )
+            # Shielded, so one caller being cancelled doesn't cancel the
+            # translation for everyone else waiting on it
+            return await asyncio.shield(task)
         except Exception as e:
-            logger.warning(f"AI translation failed, returning original: {e}")
+            logger.warning("AI translation failed, returning original: %s", e)
 
     return text
 
@@ -266,6 +380,95 @@ BOT_INTENT_PATTERNS = {
     ],
 }
 
+# Routing tables. The *_AVAILABLE flags are fixed at import, so these are
+# built once here rather than on every routed message or graph build.
+
+# Intent -> node, falling back to chat (or a related node) when an
+# optional node isn't available
+_INTENT_TO_NODE = {
+    # Travel
+    "pnr_status": "pnr_status",
+    "train_status": "train_status",
+    "metro_ticket": "metro_ticket" if METRO_AVAILABLE else "chat",
+    # Astrology
+    "get_horoscope": "get_horoscope",
+    "birth_chart": "get_horoscope",  # Route to same handler
+    "dosha": "dosha" if DOSHA_AVAILABLE else "get_horoscope",
+    "life_prediction": "life_prediction" if LIFE_PREDICTION_AVAILABLE else "get_horoscope",
+    # Subscription
+    "subscription": "subscription",
+    # Utilities
+    "weather": "weather",
+    "get_news": "get_news",
+    "image": "image_gen",
+    "set_reminder": "set_reminder",
+    "local_search": "local_search" if LOCAL_SEARCH_AVAILABLE else "chat",
+    "word_game": "word_game" if WORD_GAME_AVAILABLE else "chat",
+    "fact_check": "fact_check" if FACT_CHECK_AVAILABLE else "chat",
+    "event": "event" if EVENT_AVAILABLE else "chat",
+    "events": "event" if EVENT_AVAILABLE else "chat",  # Alias for event
+    "food": "food" if FOOD_AVAILABLE else "chat",
+    "food_order": "food" if FOOD_AVAILABLE else "chat",  # Alias for food
+    "db_query": "db_query" if DB_AVAILABLE else "chat",
+    "help": "help",
+    "chat": "chat",
+    "unknown": "chat",
+}
+
+# Routes out of START, for check_message_type
+_START_ROUTING_MAP = {
+    "image_analysis": "image_analysis",
+    "intent_detection": "intent_detection",
+    "weather": "weather",  # For location messages with pending weather request
+}
+# Add local_search route if available (for location messages with pending search)
+if LOCAL_SEARCH_AVAILABLE:
+    _START_ROUTING_MAP["local_search"] = "local_search"
+# Add food route if available
+if FOOD_AVAILABLE:
+    _START_ROUTING_MAP["food"] = "food"
+
+# Routes out of intent detection, for the nodes that are available
+_ROUTING_MAP = {
+    "pnr_status": "pnr_status",
+    "train_status": "train_status",
+    "get_horoscope": "get_horoscope",
+    "subscription": "subscription",
+    "weather": "weather",
+    "get_news": "get_news",
+    "image_gen": "image_gen",
+    "set_reminder": "set_reminder",
+    "help": "help",
+    "chat": "chat",
+}
+
+# Add optional routes
+if DOSHA_AVAILABLE:
+    _ROUTING_MAP["dosha"] = "dosha"
+if LIFE_PREDICTION_AVAILABLE:
+    _ROUTING_MAP["life_prediction"] = "life_prediction"
+if LOCAL_SEARCH_AVAILABLE:
+    _ROUTING_MAP["local_search"] = "local_search"
+if METRO_AVAILABLE:
+    _ROUTING_MAP["metro_ticket"] = "metro_ticket"
+if WORD_GAME_AVAILABLE:
+    _ROUTING_MAP["word_game"] = "word_game"
+if FACT_CHECK_AVAILABLE:
+    _ROUTING_MAP["fact_check"] = "fact_check"
+if EVENT_AVAILABLE:
+    _ROUTING_MAP["event"] = "event"
+    _ROUTING_MAP["events"] = "event"  # Alias
+if FOOD_AVAILABLE:
+    _ROUTING_MAP["food"] = "food"
+    _ROUTING_MAP["food_order"] = "food"  # Alias
+if DB_AVAILABLE:
+    _ROUTING_MAP["db_query"] = "db_query"
+
+
+# Seconds check_message_type waits for the pending location store
+PENDING_SEARCH_TIMEOUT = 0.25
+
+
 async def check_message_type(state: BotState) -> str:
     """
     Pre-router: Check message type and route accordingly.
@@ -282,7 +485,10 @@ async def check_message_type(state: BotState) -> str:
     """
     whatsapp_message = state.get("whatsapp_message", {})
     message_type = whatsapp_message.get("message_type", "text")
-    phone = whatsapp_message.get("from_number", "")
+
+    # Text is by far the most common message type
+    if message_type == "text":
+        return "intent_detection"
 
     # Route image messages directly to analysis
     if message_type == "image":
@@ -290,24 +496,33 @@ async def check_message_type(state: BotState) -> str:
 
     # Route location messages based on pending search type
     if message_type == "location":
+        phone = whatsapp_message.get("from_number", "")
         pending_store = get_pending_location_store()
-        pending = await pending_store.peek_pending_search(phone)
+        try:
+            pending = await asyncio.wait_for(
+                pending_store.peek_pending_search(phone),
+                timeout=PENDING_SEARCH_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            # Don't hold up routing on a slow store
+            logger.debug("Pending search lookup for %s timed out, going to intent detection", phone)
+            pending = None
         if pending:
             search_query = pending.get("search_query", "")
             # Route to weather handler for weather location requests
             if search_query == "__weather__":
-                logger.info(f"Location message from {phone} with pending weather request, routing to weather")
+                logger.info("Location message from %s with pending weather request, routing to weather", phone)
                 return "weather"
             # Route to food handler for food location requests
             elif search_query == "__food__":
-                logger.info(f"Location message from {phone} with pending food request, routing to food")
+                logger.info("Location message from %s with pending food request, routing to food", phone)
                 return "food" if FOOD_AVAILABLE else "local_search"
             # Default: route to local_search for other location queries
             else:
-                logger.info(f"Location message from {phone} with pending search '{search_query}', routing to local_search")
+                logger.info("Location message from %s with pending search '%s', routing to local_search", phone, search_query)
                 return "local_search"
         else:
-            logger.info(f"Location message from {phone} without pending search, going to intent detection")
+            logger.info("Location message from %s without pending search, going to intent detection", phone)
 
     # All other messages go through intent detection
     return "intent_detection"
@@ -323,39 +538,7 @@ def route_by_intent(state: BotState) -> str:
     Returns:
         Name of the next node to execute
     """
-    intent = state.get("intent", "chat")
-
-    intent_to_node = {
-        # Travel
-        "pnr_status": "pnr_status",
-        "train_status": "train_status",
-        "metro_ticket": "metro_ticket" if METRO_AVAILABLE else "chat",
-        # Astrology
-        "get_horoscope": "get_horoscope",
-        "birth_chart": "get_horoscope",  # Route to same handler
-        "dosha": "dosha" if DOSHA_AVAILABLE else "get_horoscope",
-        "life_prediction": "life_prediction" if LIFE_PREDICTION_AVAILABLE else "get_horoscope",
-        # Subscription
-        "subscription": "subscription",
-        # Utilities
-        "weather": "weather",
-        "get_news": "get_news",
-        "image": "image_gen",
-        "set_reminder": "set_reminder",
-        "local_search": "local_search" if LOCAL_SEARCH_AVAILABLE else "chat",
-        "word_game": "word_game" if WORD_GAME_AVAILABLE else "chat",
-        "fact_check": "fact_check" if FACT_CHECK_AVAILABLE else "chat",
-        "event": "event" if EVENT_AVAILABLE else "chat",
-        "events": "event" if EVENT_AVAILABLE else "chat",  # Alias for event
-        "food": "food" if FOOD_AVAILABLE else "chat",
-        "food_order": "food" if FOOD_AVAILABLE else "chat",  # Alias for food
-        "db_query": "db_query" if DB_AVAILABLE else "chat",
-        "help": "help",
-        "chat": "chat",
-        "unknown": "chat",
-    }
-
-    return intent_to_node.get(intent, "chat")
+    return _INTENT_TO_NODE.get(state.get("intent", "chat"), "chat")
 
 
 def check_fallback(state: BotState) -> Literal["fallback", "end"]:
@@ -382,139 +565,47 @@ def create_graph() -> StateGraph:
     """
     graph = StateGraph(BotState)
 
+    # Handler nodes, each of which can go to fallback or end
+    handler_nodes = []
+
+    def add_handler(name: str, handler: Callable) -> None:
+        graph.add_node(name, handler)
+        handler_nodes.append(name)
+
     # Add all nodes
     graph.add_node("intent_detection", detect_intent)
-    graph.add_node("chat", handle_chat)
-    graph.add_node("weather", handle_weather)
-    graph.add_node("get_news", handle_news)
-    graph.add_node("pnr_status", handle_pnr_status)
-    graph.add_node("train_status", handle_train_status)
-    graph.add_node("get_horoscope", handle_horoscope)
-    graph.add_node("subscription", handle_subscription)
-    graph.add_node("image_gen", handle_image_generation)
-    graph.add_node("image_analysis", handle_image_analysis)
-    graph.add_node("set_reminder", handle_reminder)
-    graph.add_node("help", handle_help)
+    add_handler("chat", handle_chat)
+    add_handler("weather", handle_weather)
+    add_handler("get_news", handle_news)
+    add_handler("pnr_status", handle_pnr_status)
+    add_handler("train_status", handle_train_status)
+    add_handler("get_horoscope", handle_horoscope)
+    add_handler("subscription", handle_subscription)
+    add_handler("image_gen", handle_image_generation)
+    add_handler("image_analysis", handle_image_analysis)
+    add_handler("set_reminder", handle_reminder)
+    add_handler("help", handle_help)
     graph.add_node("fallback", handle_fallback)
 
     # Add optional nodes if available
-    if DOSHA_AVAILABLE and handle_dosha:
-        graph.add_node("dosha", handle_dosha)
-    if LIFE_PREDICTION_AVAILABLE and handle_life_prediction:
-        graph.add_node("life_prediction", handle_life_prediction)
-    if LOCAL_SEARCH_AVAILABLE and handle_local_search:
-        graph.add_node("local_search", handle_local_search)
-    if METRO_AVAILABLE and handle_metro_ticket:
-        graph.add_node("metro_ticket", handle_metro_ticket)
-    if WORD_GAME_AVAILABLE and handle_word_game:
-        graph.add_node("word_game", handle_word_game)
-    if FACT_CHECK_AVAILABLE and handle_fact_check:
-        graph.add_node("fact_check", handle_fact_check)
-    if EVENT_AVAILABLE and handle_event:
-        graph.add_node("event", handle_event)
-    if FOOD_AVAILABLE and handle_food:
-        graph.add_node("food", handle_food)
-    if DB_AVAILABLE and handle_db_query:
-        graph.add_node("db_query", handle_db_query)
+    for node, handler in OPTIONAL_NODE_HANDLERS.items():
+        add_handler(node, handler)
 
     # Define edges - First check message type
-    # Build start routing map
-    start_routing_map = {
-        "image_analysis": "image_analysis",
-        "intent_detection": "intent_detection",
-        "weather": "weather",  # For location messages with pending weather request
-    }
-    # Add local_search route if available (for location messages with pending search)
-    if LOCAL_SEARCH_AVAILABLE:
-        start_routing_map["local_search"] = "local_search"
-    # Add food route if available
-    if FOOD_AVAILABLE:
-        start_routing_map["food"] = "food"
-
     graph.add_conditional_edges(
         START,
         check_message_type,
-        start_routing_map,
+        _START_ROUTING_MAP,
     )
 
-    # Build routing map dynamically based on available nodes
-    routing_map = {
-        "pnr_status": "pnr_status",
-        "train_status": "train_status",
-        "get_horoscope": "get_horoscope",
-        "subscription": "subscription",
-        "weather": "weather",
-        "get_news": "get_news",
-        "image_gen": "image_gen",
-        "set_reminder": "set_reminder",
-        "help": "help",
-        "chat": "chat",
-    }
-
-    # Add optional routes
-    if DOSHA_AVAILABLE:
-        routing_map["dosha"] = "dosha"
-    if LIFE_PREDICTION_AVAILABLE:
-        routing_map["life_prediction"] = "life_prediction"
-    if LOCAL_SEARCH_AVAILABLE:
-        routing_map["local_search"] = "local_search"
-    if METRO_AVAILABLE:
-        routing_map["metro_ticket"] = "metro_ticket"
-    if WORD_GAME_AVAILABLE:
-        routing_map["word_game"] = "word_game"
-    if FACT_CHECK_AVAILABLE:
-        routing_map["fact_check"] = "fact_check"
-    if EVENT_AVAILABLE:
-        routing_map["event"] = "event"
-        routing_map["events"] = "event"  # Alias
-    if FOOD_AVAILABLE:
-        routing_map["food"] = "food"
-        routing_map["food_order"] = "food"  # Alias
-    if DB_AVAILABLE:
-        routing_map["db_query"] = "db_query"
-
     # Intent Detection -> Route to appropriate handler
     graph.add_conditional_edges(
         "intent_detection",
         route_by_intent,
-        routing_map,
+        _ROUTING_MAP,
     )
 
     # Each handler can go to fallback or end
-    handler_nodes = [
-        "chat",
-        "weather",
-        "get_news",
-        "pnr_status",
-        "train_status",
-        "get_horoscope",
-        "subscription",
-        "image_gen",
-        "image_analysis",
-        "set_reminder",
-        "help",
-    ]
-
-    # Add optional handler nodes
-    if DOSHA_AVAILABLE:
-        handler_nodes.append("dosha")
-    if LIFE_PREDICTION_AVAILABLE:
-        handler_nodes.append("life_prediction")
-    if LOCAL_SEARCH_AVAILABLE:
-        handler_nodes.append("local_search")
-    if METRO_AVAILABLE:
-        handler_nodes.append("metro_ticket")
-    if WORD_GAME_AVAILABLE:
-        handler_nodes.append("word_game")
-    if FACT_CHECK_AVAILABLE:
-        handler_nodes.append("fact_check")
-    if EVENT_AVAILABLE:
-        handler_nodes.append("event")
-    if FOOD_AVAILABLE:
-        handler_nodes.append("food")
-    if DB_AVAILABLE:
-        handler_nodes.append("db_query")
-
     for node in handler_nodes:
         graph.add_conditional_edges(
             node,
@@ -531,35 +622,60 @@ def create_graph() -> StateGraph:
     return graph
 
 
+# Compiled graphs by checkpointer identity, least recently used first. Each
+# entry keeps its checkpointer alive too, so the id can't be reused by another
+# object while cached; the size bound stops callers that pass a fresh
+# checkpointer per request from holding on to every one of them.
+MAX_COMPILED_GRAPHS = 8
+_compiled_graphs: OrderedDict[int, tuple] = OrderedDict()
+_graph_lock = threading.Lock()
+
+
 def get_compiled_graph(checkpointer=None):
     """
     Get a compiled graph ready for execution.
 
+    The graph is built and compiled once per checkpointer and reused after
+    that, for the MAX_COMPILED_GRAPHS most recently used checkpointers. Cache
+    hits don't take the lock. A miss compiles outside the lock and only
+    publishes the result under it, so compiling for a new checkpointer never
+    stalls other callers. If first callers race (e.g. via
+    process_message_sync), the first published graph wins.
+
     Args:
         checkpointer: Optional checkpointer instance
 
     Returns:
         Compiled graph
     """
-    graph = create_graph()
-    return graph.compile(checkpointer=checkpointer)
-
-
-# Singleton instance
-_graph = None
+    key = id(checkpointer)
+    entry = _compiled_graphs.get(key)
+    if entry is not None:
+        try:
+            _compiled_graphs.move_to_end(key)
+        except KeyError:
+            pass  # Evicted by another thread meanwhile; the entry is still valid
+        return entry[1]
+
+    compiled = create_graph().compile(checkpointer=checkpointer)
+    with _graph_lock:
+        entry = _compiled_graphs.get(key)
+        if entry is None:
+            entry = (checkpointer, compiled)
+            _compiled_graphs[key] = entry
+            if len(_compiled_graphs) > MAX_COMPILED_GRAPHS:
+                _compiled_graphs.popitem(last=False)
+    return entry[1]
 
 
 def get_graph():
     """
-    Get or create the singleton graph instance.
+    Get the singleton graph instance (no checkpointer).
 
     Returns:
         Compiled LangGraph instance
     """
-    global _graph
-    if _graph is None:
-        _graph = get_compiled_graph(checkpointer=None)
-    return _graph
+    return get_compiled_graph(checkpointer=None)
 
 
 async def process_message(whatsapp_message: Dict) -> Dict:
@@ -586,10 +702,12 @@ async def process_message(whatsapp_message: Dict) -> Dict:
 
     response_text = result.get("response_text", "")
     response_type = result.get("response_type", "text")
-    detected_lang = result.get("detected_language") or await _detect_language(
-        whatsapp_message.get("text", "")
-    )
-    if response_type in ["text", "location_request"] and response_text:
+    # Only text replies get translated, so only they need the language; the
+    # intent node normally sets it already, leaving detection as a fallback
+    if response_type in ("text", "location_request") and response_text:
+        detected_lang = result.get("detected_language") or await _detect_language(
+            whatsapp_message.get("text", "")
+        )
         response_text = await _translate_response(response_text, detected_lang)
 
     return {
@@ -603,6 +721,33 @@ async def process_message(whatsapp_message: Dict) -> Dict:
     }
 
 
+# Event loop per calling thread for process_message_sync, reused across calls
+# instead of creating and tearing one down each time like asyncio.run(). Not
+# shared between threads: nodes such as detect_intent still make blocking
+# LLM calls, which would serialize every sync caller on a single loop.
+_sync_loops = threading.local()
+
+
 def process_message_sync(whatsapp_message: Dict) -> Dict:
-    """Synchronous version of process_message."""
-    return asyncio.run(process_message(whatsapp_message))
+    """
+    Synchronous version of process_message.
+
+    Raises:
+        RuntimeError: If called from a thread that is already running an
+            event loop; await process_message() there instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError(
+            "process_message_sync() cannot be called from a running event loop; "
+            "await process_message() instead"
+        )
+
+    loop = getattr(_sync_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _sync_loops.loop = loop
+    return loop.run_until_complete(process_message(whatsapp_message))
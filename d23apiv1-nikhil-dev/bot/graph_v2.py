@@ -27,10 +27,12 @@ To use this new architecture:
 
 import asyncio
 import logging
-from typing import Literal
+import re
+from typing import Dict, Literal
 from langgraph.graph import StateGraph, START, END
-from langgraph.checkpoint.postgres import PostgresSaver
-from psycopg_pool import ConnectionPool
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +74,81 @@ from bot.nodes.chat import handle_chat, handle_fallback
 from bot.nodes.intent import detect_intent
 
 
+# Node for each classified domain
+DOMAIN_TO_NODE = {
+    "astrology": "astrology_graph",
+    "travel": "travel_router",
+    "utility": "utility_router",
+    "game": "game",
+    "conversation": "chat",
+}
+
+# Travel keywords by intent, in priority order
+TRAVEL_KEYWORDS = {
+    "pnr_status": ("pnr",),
+    "train_status": ("train", "running status"),
+    "metro_ticket": ("metro",),
+}
+
+# Handler node for each travel / utility intent
+TRAVEL_HANDLERS = {
+    "pnr_status": "pnr_status",
+    "train_status": "train_status",
+    "metro_ticket": "metro_ticket",
+}
+UTILITY_HANDLERS = {
+    "weather": "weather",
+    "news": "news",
+    "image": "image_gen",
+    "reminder": "reminder",
+    "local_search": "local_search",
+    "db_query": "db_query",
+}
+
+# Utility keywords by intent, in priority order
+UTILITY_KEYWORDS = {
+    "weather": ("weather", "temperature", "forecast", "rain"),
+    "news": ("news", "headlines", "breaking"),
+    "image": ("generate image", "create image", "draw", "picture"),
+    "reminder": ("remind", "reminder", "alarm"),
+    "local_search": ("search", "find", "near me", "nearby"),
+}
+
+# Place types that make a query a local search when a location is given
+UTILITY_PLACES = (
+    "hospital", "restaurant", "hotel", "atm", "bank", "pharmacy",
+    "petrol", "gas station", "mall", "shop", "store", "clinic",
+    "school", "college", "gym", "park", "temple", "mosque", "church",
+    "police", "airport", "railway station", "bus stand", "metro station",
+)
+UTILITY_LOCATION_WORDS = ("in", "at", "near", "around")
+
+
+def _keyword_alternation(keywords) -> str:
+    return "|".join(map(re.escape, keywords))
+
+
+def _compile_keyword_router(keywords_by_intent) -> "re.Pattern[str]":
+    """
+    Compile all of a router's keywords into one regex.
+
+    It is matched at the start of the query and each intent's branch lazily
+    scans ahead for its keywords, so an earlier intent wins whenever its
+    keyword occurs anywhere, as with the old chain of substring checks; the
+    named group that matched is the intent.
+    """
+    return re.compile("|".join(
+        rf"(?s:.*?)(?P<{intent}>{_keyword_alternation(keywords)})"
+        for intent, keywords in keywords_by_intent.items()
+    ))
+
+
+TRAVEL_KEYWORD_RE = _compile_keyword_router(TRAVEL_KEYWORDS)
+UTILITY_KEYWORD_RE = _compile_keyword_router(UTILITY_KEYWORDS)
+UTILITY_PLACE_RE = re.compile(_keyword_alternation(UTILITY_PLACES))
+UTILITY_LOCATION_RE = re.compile(_keyword_alternation(UTILITY_LOCATION_WORDS))
+
+
 def route_by_domain(state: BotState) -> str:
     """
     Route to domain-specific handler based on classification.
@@ -82,17 +159,7 @@ def route_by_domain(state: BotState) -> str:
     Returns:
         Node name to route to
     """
-    domain = state.get("domain", "conversation")
-
-    domain_to_node = {
-        "astrology": "astrology_graph",
-        "travel": "travel_router",
-        "utility": "utility_router",
-        "game": "game",
-        "conversation": "chat",
-    }
-
-    return domain_to_node.get(domain, "chat")
+    return DOMAIN_TO_NODE.get(state.get("domain", "conversation"), "chat")
 
 
 def route_travel(state: BotState) -> dict:
@@ -107,26 +174,15 @@ def route_travel(state: BotState) -> dict:
     Returns:
         Updated state with travel_intent
     """
-    query = state.get("current_query", "").lower()
+    query = state.get("current_query_lower") or state.get("current_query", "").lower()
 
-    if "pnr" in query:
-        return {"travel_intent": "pnr_status"}
-    elif "train" in query or "running status" in query:
-        return {"travel_intent": "train_status"}
-    elif "metro" in query:
-        return {"travel_intent": "metro_ticket"}
-    else:
-        return {"travel_intent": "train_status"}
+    match = TRAVEL_KEYWORD_RE.match(query)
+    return {"travel_intent": match.lastgroup if match else "train_status"}
 
 
 def select_travel_handler(state: BotState) -> str:
     """Select travel handler based on intent."""
-    travel_intent = state.get("travel_intent", "train_status")
-    return {
-        "pnr_status": "pnr_status",
-        "train_status": "train_status",
-        "metro_ticket": "metro_ticket",
-    }.get(travel_intent, "train_status")
+    return TRAVEL_HANDLERS.get(state.get("travel_intent", "train_status"), "train_status")
 
 
 def route_utility(state: BotState) -> dict:
@@ -145,41 +201,20 @@ def route_utility(state: BotState) -> dict:
     if state.get("utility_intent"):
         return {"utility_intent": state.get("utility_intent")}
 
-    query = state.get("current_query", "").lower()
-
-    if any(kw in query for kw in ["weather", "temperature", "forecast", "rain"]):
-        return {"utility_intent": "weather"}
-    elif any(kw in query for kw in ["news", "headlines", "breaking"]):
-        return {"utility_intent": "news"}
-    elif any(kw in query for kw in ["generate image", "create image", "draw", "picture"]):
-        return {"utility_intent": "image"}
-    elif any(kw in query for kw in ["remind", "reminder", "alarm"]):
-        return {"utility_intent": "reminder"}
-    elif any(kw in query for kw in ["search", "find", "near me", "nearby"]):
-        return {"utility_intent": "local_search"}
+    query = state.get("current_query_lower") or state.get("current_query", "").lower()
+
+    match = UTILITY_KEYWORD_RE.match(query)
+    if match:
+        return {"utility_intent": match.lastgroup}
     # Check for place-based queries (hospitals, restaurants, etc.)
-    elif any(kw in query for kw in [
-        "hospital", "restaurant", "hotel", "atm", "bank", "pharmacy",
-        "petrol", "gas station", "mall", "shop", "store", "clinic",
-        "school", "college", "gym", "park", "temple", "mosque", "church",
-        "police", "airport", "railway station", "bus stand", "metro station"
-    ]) and any(loc in query for loc in ["in", "at", "near", "around"]):
+    if UTILITY_PLACE_RE.search(query) and UTILITY_LOCATION_RE.search(query):
         return {"utility_intent": "local_search"}
-    else:
-        return {"utility_intent": "db_query"}
+    return {"utility_intent": "db_query"}
 
 
 def select_utility_handler(state: BotState) -> str:
     """Select utility handler based on intent."""
-    utility_intent = state.get("utility_intent", "db_query")
-    return {
-        "weather": "weather",
-        "news": "news",
-        "image": "image_gen",
-        "reminder": "reminder",
-        "local_search": "local_search",
-        "db_query": "db_query",
-    }.get(utility_intent, "db_query")
+    return UTILITY_HANDLERS.get(state.get("utility_intent", "db_query"), "db_query")
 
 
 def check_fallback(state: BotState) -> Literal["fallback", "end"]:
@@ -204,7 +239,10 @@ async def enrich_context_node(state: BotState) -> dict:
     Returns:
         Enriched state with context info
     """
-    return await enrich_with_context(state)
+    enriched = await enrich_with_context(state)
+    # Lowercase the query once here for all the keyword routers after this
+    enriched["current_query_lower"] = (enriched.get("current_query") or "").lower()
+    return enriched
 
 
 def create_graph_v2() -> StateGraph:
@@ -380,33 +418,74 @@ def get_compiled_graph_v2(checkpointer=None):
     return graph.compile(checkpointer=checkpointer)
 
 
-# Singleton instance
-_graph_v2 = None
+# Compiled graph and its connection pool per event loop. The async pool and
+# checkpointer only work on the loop they were opened on, so every loop (the
+# server's, or a fresh one from asyncio.run) gets its own. Entries for loops
+# that have since closed are dropped on the next miss.
+_graphs_v2: Dict[asyncio.AbstractEventLoop, tuple] = {}
+_graph_v2_locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
 
+def _forget_closed_loops() -> None:
+    for loop in [loop for loop in _graphs_v2 if loop.is_closed()]:
+        del _graphs_v2[loop]
+    for loop in [loop for loop in _graph_v2_locks if loop.is_closed()]:
+        del _graph_v2_locks[loop]
 
-def get_graph_v2():
+
+async def get_graph_v2():
     """
-    Get or create the singleton graph instance.
+    Get or create the graph instance for the running event loop.
+
+    The checkpointer is async so checkpoint reads and writes run on the
+    event loop instead of being serialized behind the sync saver's lock.
+    That ties the graph to the loop it was created on; call close_graph_v2()
+    on that loop before it shuts down to release its connections.
 
     Returns:
         Compiled LangGraph instance
     """
-    global _graph_v2
-    if _graph_v2 is None:
-        # Create DB URI from settings
-        db_uri = f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
+    loop = asyncio.get_running_loop()
+    entry = _graphs_v2.get(loop)
+    if entry is not None:
+        return entry[0]
+
+    _forget_closed_loops()
+    lock = _graph_v2_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        entry = _graphs_v2.get(loop)
+        if entry is None:
+            # Create DB URI from settings
+            db_uri = f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
+
+            # Initialize connection pool. The saver needs autocommit so
+            # setup() persists and dict rows for column-name access.
+            pool = AsyncConnectionPool(
+                conninfo=db_uri,
+                max_size=20,
+                kwargs={"autocommit": True, "row_factory": dict_row},
+                open=False,
+            )
+            await pool.open()
+
+            # Initialize checkpointer
+            checkpointer = AsyncPostgresSaver(pool)
 
-        # Initialize connection pool
-        pool = ConnectionPool(conninfo=db_uri, max_size=20)
+            # Ensure schema exists
+            await checkpointer.setup()
 
-        # Initialize checkpointer
-        checkpointer = PostgresSaver(pool)
+            entry = (get_compiled_graph_v2(checkpointer=checkpointer), pool)
+            _graphs_v2[loop] = entry
+    return entry[0]
 
-        # Ensure schema exists
-        checkpointer.setup()
 
-        _graph_v2 = get_compiled_graph_v2(checkpointer=checkpointer)
-    return _graph_v2
+async def close_graph_v2() -> None:
+    """Close the running event loop's graph connection pool, if it has one."""
+    loop = asyncio.get_running_loop()
+    _graph_v2_locks.pop(loop, None)
+    entry = _graphs_v2.pop(loop, None)
+    if entry is not None:
+        await entry[1].close()
 
 
 async def process_message_v2(whatsapp_message: dict) -> dict:
@@ -421,7 +500,7 @@ async def process_message_v2(whatsapp_message: dict) -> dict:
     Returns:
         Response dictionary
     """
-    graph = get_graph_v2()
+    graph = await get_graph_v2()
 
     # Create initial state
     initial_state = create_initial_state(
@@ -99,6 +99,7 @@ class BotState(TypedDict):
 
     # Processing state
     current_query: str
+    current_query_lower: Optional[str]  # Set once by enrich_context for the routers
 
     # Language detection (multi-language support)
     detected_language: str  # Language code: en, hi, bn, ta, te, ml, kn, pa, mr, or
@@ -0,0 +1,87 @@
+"""
+Tests for Follow-up Handler
+
+Pins the priority order and anchoring of the follow-up analyzer's combined
+regex, so changes to the phrase tables or pattern building show up here.
+"""
+
+import pytest
+from bot.followup_handler import FollowupAnalyzer, FollowupType
+
+
+CONTEXT = {"last_topic": "kundli"}
+
+
+@pytest.fixture
+def analyzer() -> FollowupAnalyzer:
+    return FollowupAnalyzer()
+
+
+class TestFollowupAnalyzer:
+    """Test follow-up detection."""
+
+    @pytest.mark.parametrize("message,language,expected_type,expected_reason", [
+        # Phrases match only at the start of the message
+        ("yes please", "en", FollowupType.CONFIRMATION, "confirmation:yes please"),
+        ("no", "en", FollowupType.NEGATION, "negation:no"),
+        ("i said yes", "en", FollowupType.NEW_TOPIC, "no_continuation_pattern_detected"),
+        ("yesterday was fine", "en", FollowupType.NEW_TOPIC, "no_continuation_pattern_detected"),
+
+        # Categories are tried in priority order
+        ("what about career", "en", FollowupType.TOPIC_CONTINUATION, "continuation_phrase:what about"),
+        ("tell me more", "en", FollowupType.CLARIFICATION, "clarification_phrase:tell me more"),
+        ("why is mars weak", "en", FollowupType.ELABORATION, "elaboration_phrase:why"),
+        ("aur batao", "hi", FollowupType.TOPIC_CONTINUATION, "continuation_phrase:aur batao"),
+
+        # Romanized phrases belong to their own language
+        ("haan ji", "hi", FollowupType.CONFIRMATION, "confirmation:haan"),
+        ("haan ji", "en", FollowupType.NEW_TOPIC, "no_continuation_pattern_detected"),
+
+        # Native-script text with no entity is a new topic
+        ("मेरी कुंडली बताओ", "hi", FollowupType.NEW_TOPIC, "no_continuation_pattern_detected"),
+        ("আমার রাশিফল", "bn", FollowupType.NEW_TOPIC, "no_continuation_pattern_detected"),
+    ])
+    def test_followup_classification(
+        self,
+        analyzer: FollowupAnalyzer,
+        message: str,
+        language: str,
+        expected_type: FollowupType,
+        expected_reason: str,
+    ):
+        """Test that messages are classified to the right follow-up type."""
+        result = analyzer.analyze(message, CONTEXT, language)
+
+        assert result.followup_type is expected_type, \
+            f"Message '{message}' classified as '{result.followup_type.value}', expected '{expected_type.value}'"
+        assert result.reason == expected_reason
+
+    def test_entity_found_anywhere_in_message(self, analyzer: FollowupAnalyzer):
+        """Test entity patterns are searched past the start of the message."""
+        result = analyzer.analyze("mars in 7th house", CONTEXT, "en")
+
+        assert result.followup_type is FollowupType.ENTITY_REFERENCE
+        assert result.referenced_entity == "7th house"
+        assert result.reason == "entity_reference:house:7th house"
+
+    def test_topic_continuation_extracts_topic(self, analyzer: FollowupAnalyzer):
+        """Test the asked-about topic is extracted from a continuation."""
+        result = analyzer.analyze("what about career", CONTEXT, "en")
+        assert result.referenced_topic == "career"
+
+    def test_unknown_language_falls_back_to_english(self, analyzer: FollowupAnalyzer):
+        """Test an unsupported language code uses the English phrases."""
+        assert analyzer.analyze("yes please", CONTEXT, "xx") == \
+            analyzer.analyze("yes please", CONTEXT, "en")
+        assert analyzer.analyze("haan", CONTEXT, "xx").followup_type is FollowupType.NEW_TOPIC
+
+    def test_no_context_is_unknown(self, analyzer: FollowupAnalyzer):
+        """Test an unmatched message without context is unknown, not a new topic."""
+        result = analyzer.analyze("hello there", None, "en")
+
+        assert result.followup_type is FollowupType.UNKNOWN
+        assert result.should_use_context is False
+
+    def test_case_and_whitespace_insensitive(self, analyzer: FollowupAnalyzer):
+        """Test messages are normalized before matching."""
+        assert analyzer.analyze("  YES Please ", CONTEXT, "en").followup_type is FollowupType.CONFIRMATION
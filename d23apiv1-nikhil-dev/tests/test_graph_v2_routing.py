@@ -0,0 +1,67 @@
+"""
+Tests for Graph V2 Routing
+
+Tests the keyword routers that pick a handler inside the travel and utility
+domains. Keywords are plain substrings tried in priority order.
+"""
+
+import pytest
+
+pytest.importorskip("langgraph")
+
+from bot.graph_v2 import route_travel, route_utility, select_utility_handler
+
+
+class TestTravelRouting:
+    """Test travel intent routing."""
+
+    @pytest.mark.parametrize("query,expected_intent", [
+        ("pnr 1234567890", "pnr_status"),
+        ("pnr1234567890", "pnr_status"),
+        ("check pnr of train 12301", "pnr_status"),
+        ("train 12301", "train_status"),
+        ("running status", "train_status"),
+        ("metro card", "metro_ticket"),
+        ("hello", "train_status"),
+    ])
+    def test_travel_intent(self, query: str, expected_intent: str):
+        """Test that travel queries get the right intent."""
+        assert route_travel({"current_query": query}) == {"travel_intent": expected_intent}
+
+
+class TestUtilityRouting:
+    """Test utility intent routing."""
+
+    @pytest.mark.parametrize("query,expected_intent", [
+        # Earlier intents win wherever their keyword occurs
+        ("weather news today", "weather"),
+        ("latest news", "news"),
+        ("generate image of a cat", "image"),
+        ("remind me at 5", "reminder"),
+        ("find atm", "local_search"),
+
+        # A place type only counts with a location word
+        ("gas station in pune", "local_search"),
+        ("hospital around andheri", "local_search"),
+        ("hospital", "db_query"),
+
+        # Default
+        ("show my orders", "db_query"),
+    ])
+    def test_utility_intent(self, query: str, expected_intent: str):
+        """Test that utility queries get the right intent."""
+        assert route_utility({"current_query": query}) == {"utility_intent": expected_intent}
+
+    def test_lowered_query_is_preferred(self):
+        """Test the precomputed lowercase query is used when present."""
+        state = {"current_query": "WEATHER", "current_query_lower": "latest news"}
+        assert route_utility(state) == {"utility_intent": "news"}
+
+    def test_preset_intent_is_kept(self):
+        """Test an intent set upstream (e.g. for location messages) is kept."""
+        state = {"current_query": "weather", "utility_intent": "local_search"}
+        assert route_utility(state) == {"utility_intent": "local_search"}
+
+    def test_image_intent_selects_image_node(self):
+        """Test intents map to their handler node names."""
+        assert select_utility_handler({"utility_intent": "image"}) == "image_gen"